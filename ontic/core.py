@@ -6,7 +6,10 @@
 
 """
 
+import threading
 from copy import copy, deepcopy
+from datetime import date, datetime, time
+from typing import Any
 
 
 class Core(dict):
@@ -62,5 +65,178 @@ class Core(dict):
         return type(self)(copy(dict(self)))
 
     def __deepcopy__(self, memo) -> 'Core':
-        the_copy = dict(self.__dict__)
-        return type(self)(deepcopy(the_copy))
+        if memo is None:
+            memo = {}
+        # The copy is registered before its values are copied, so that a
+        # value referring back to this instance refers to the copy.
+        the_copy = type(self).__new__(type(self))
+        memo[id(self)] = the_copy
+        the_copy.__init__({key: fast_deepcopy(value, memo)
+                           for key, value in self.items()})
+        return the_copy
+
+
+class VersionedCore(Core):
+    """A :class:`Core` that takes a new version stamp whenever it is changed.
+
+    The stamp is renewed by item and attribute assignment or deletion, and
+    by the dict methods that modify the contents. Changes made to a value
+    held by the instance, such as adding to a set value, do not renew the
+    stamp. The stamp is kept in a slot, so it is not one of the dict keys.
+
+    The stamps come from one counter shared by the whole process, so any
+    write to any :class:`ontic.Schema` or :class:`ontic.OnticProperty`
+    advances the version that every **Ontic** type checks its prepared
+    validators and defaults against. A type whose own schema is unchanged
+    keeps what it prepared, after comparing the stamps of its schema.
+    """
+    __slots__ = ('_ontic_version',)
+
+    def __setattr__(self, name, value):
+        super(VersionedCore, self).__setattr__(name, value)
+        _stamp(self)
+
+    def __delattr__(self, name):
+        super(VersionedCore, self).__delattr__(name)
+        _stamp(self)
+
+    def __setitem__(self, key, value):
+        super(VersionedCore, self).__setitem__(key, value)
+        _stamp(self)
+
+    def __delitem__(self, key):
+        super(VersionedCore, self).__delitem__(key)
+        _stamp(self)
+
+    def __ior__(self, other):
+        result = super(VersionedCore, self).__ior__(other)
+        _stamp(self)
+        return result
+
+    def clear(self):
+        super(VersionedCore, self).clear()
+        _stamp(self)
+
+    def pop(self, *args):
+        result = super(VersionedCore, self).pop(*args)
+        _stamp(self)
+        return result
+
+    def popitem(self):
+        result = super(VersionedCore, self).popitem()
+        _stamp(self)
+        return result
+
+    def setdefault(self, *args):
+        result = super(VersionedCore, self).setdefault(*args)
+        _stamp(self)
+        return result
+
+    def update(self, *args, **kwargs):
+        super(VersionedCore, self).update(*args, **kwargs)
+        _stamp(self)
+
+
+#: The last version stamp issued to a VersionedCore.
+_version = 0
+
+#: Serializes the issue of version stamps.
+_version_lock = threading.Lock()
+
+
+def _stamp(value: VersionedCore) -> None:
+    """Give a changed VersionedCore the next version stamp."""
+    global _version
+    with _version_lock:
+        version = _version + 1
+        # The instance is stamped before the stamp is published, so a reader
+        # that sees the new _current_version also sees the changed instance.
+        object.__setattr__(value, '_ontic_version', version)
+        _version = version
+
+
+def _current_version() -> int:
+    """Get the last version stamp issued to any :class:`VersionedCore`.
+
+    :return: The last version stamp issued, or 0 if none has been issued.
+    """
+    return _version
+
+
+def _version_of(value: Any) -> int:
+    """Get the version stamp of a value.
+
+    :param value: The value whose version stamp is required.
+    :return: The stamp of a :class:`VersionedCore`, or 0 for other values.
+    """
+    if isinstance(value, VersionedCore):
+        return value._ontic_version
+    return 0
+
+
+#: The types whose values are returned by *fast_deepcopy* without copying.
+_IMMUTABLE_TYPES = frozenset({
+    type(None), bool, bytes, complex, date, datetime, float, int, str, time,
+    type})
+
+#: The container types that *fast_deepcopy* copies itself.
+_CONTAINER_TYPES = frozenset({dict, list, set, tuple})
+
+#: Marks a value that is not in the memo of *fast_deepcopy*.
+_MISSING = object()
+
+
+def fast_deepcopy(value: Any, memo: dict = None) -> Any:
+    """Deep copy a value built from the builtin container types.
+
+    The dict, list, set and tuple containers are copied directly and the
+    immutable builtin values are returned as they are, which avoids the
+    dispatch overhead of :func:`copy.deepcopy`. Any other value is copied
+    with :func:`copy.deepcopy`.
+
+    As with :func:`copy.deepcopy`, the *memo* records each container that
+    is copied, so a container that is referenced more than once is copied
+    once, and a container may refer to itself. Empty containers skip the
+    memo and are returned as a new empty container of the same type.
+
+    :param value: The value to be copied.
+    :param memo: The memo dictionary shared with :func:`copy.deepcopy`.
+    :return: A deep copy of *value*.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    # A new empty container has no shared identity for the memo to keep.
+    if value_type in _CONTAINER_TYPES and not value:
+        return value_type()
+    if memo is None:
+        memo = {}
+    value_id = id(value)
+    the_copy = memo.get(value_id, _MISSING)
+    if the_copy is not _MISSING:
+        return the_copy
+
+    if value_type is dict:
+        the_copy = memo[value_id] = {}
+        for key, item in value.items():
+            the_copy[fast_deepcopy(key, memo)] = fast_deepcopy(item, memo)
+    elif value_type is list:
+        the_copy = memo[value_id] = []
+        the_copy.extend(fast_deepcopy(item, memo) for item in value)
+    elif value_type is set:
+        the_copy = memo[value_id] = {
+            fast_deepcopy(item, memo) for item in value}
+    elif value_type is tuple:
+        items = [fast_deepcopy(item, memo) for item in value]
+        # A tuple holding a reference to itself is copied by the recursion.
+        the_copy = memo.get(value_id, _MISSING)
+        if the_copy is not _MISSING:
+            return the_copy
+        if all(copied is item for copied, item in zip(items, value)):
+            the_copy = value
+        else:
+            the_copy = tuple(items)
+        memo[value_id] = the_copy
+    else:
+        the_copy = deepcopy(value, memo)
+    return the_copy
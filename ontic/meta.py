@@ -5,8 +5,10 @@
 .. contents::
 
 """
+import functools
 import re
 from datetime import date, datetime, time
+from itertools import repeat
 from typing import Any, NoReturn, Callable
 
 import ontic
@@ -295,7 +297,7 @@ def validate_member_regex(
         validation fails, then an error message is added to the
         value_errors list.
     """
-    if not re.match(property_schema.regex, member_value):
+    if not _compile_regex(property_schema.regex).match(member_value):
         value_errors.append(
             'Value "%s" for "%s" does not meet regex: %s' %
             (member_value, property_schema.name, property_schema.regex))
@@ -444,12 +446,371 @@ def non_none_singular_validation(
     # regex validation
     if property_schema.regex:
         if property_schema.type is str and value != '':
-            if not re.match(property_schema.regex, value):
+            if not _compile_regex(property_schema.regex).match(value):
                 value_errors.append(
                     'Value "%s" for %s does not meet regex: %s' %
                     (value, property_schema.name, property_schema.regex))
 
 
+def compile_validator(
+        property_schema: 'OnticProperty') -> Callable[[Any, list[str]], None]:
+    """Compile a property schema into a validator function.
+
+    The returned validator applies the same rules, and reports the same
+    errors, as :meth:`validate_value`. The schema settings are resolved
+    when the validator is compiled, so only the checks that apply to the
+    property are run during validation.
+
+    :param property_schema: The property schema that contains the validation
+        rules.
+    :return: A validator that is called with the value to be validated and
+        the list that collects the errors found.
+    """
+    name = property_schema.name
+    required = property_schema.required
+    required_error = 'The value for "%s" is required.' % name
+    validate_non_none = _compile_non_none_validator(property_schema)
+
+    def validator(value: Any, value_errors: list[str]) -> NoReturn:
+        if value is None:
+            if required:
+                value_errors.append(required_error)
+        else:
+            validate_non_none(value, value_errors)
+
+    return validator
+
+
+def _compile_non_none_validator(
+        property_schema: 'OnticProperty') -> Callable[[Any, list[str]], None]:
+    """Compile the validation of a non-None value.
+
+    :param property_schema: The property schema to utilize for validation.
+    :return: A validator mirroring :meth:`validate_non_none_value`.
+    """
+    schema_type = property_schema.type
+    type_error = _error_format(
+        'The value for "%s" is not of type "%s": %s',
+        property_schema.name, schema_type, _VALUE_SLOT)
+
+    if not schema_type:
+        # if no schema_type, then just check that
+        # the value is in an enum if necessary.
+        checks = _compile_enum_checks(property_schema)
+    elif schema_type in COLLECTION_TYPES:
+        checks = (_compile_bound_checks(property_schema) +
+                  _compile_member_checks(property_schema))
+    else:
+        checks = (_compile_enum_checks(property_schema) +
+                  _compile_bound_checks(property_schema) +
+                  _compile_regex_checks(property_schema))
+
+    def validator(value: Any, value_errors: list[str],
+                  _type: Callable = type,
+                  _isinstance: Callable = isinstance) -> NoReturn:
+        # The exact type test is a cheap pass for values that are not of a
+        # subclass; isinstance still decides the rest, such as bool for int.
+        if (schema_type and _type(value) is not schema_type and
+                not _isinstance(value, schema_type)):
+            value_errors.append(type_error % (value,))
+            # If not of the expected type, than can't further
+            # validate without errors.
+            return
+        for check in checks:
+            check(value, value_errors)
+
+    return validator
+
+
+def _compile_enum_checks(property_schema: 'OnticProperty') -> list[Callable]:
+    """Compile the enumeration check of a non-collection property.
+
+    :param property_schema: The property schema to utilize for validation.
+    :return: A list holding the enum check, or empty if no enum is set.
+    """
+    enum = property_schema.enum
+    if not enum:
+        return []
+    enum, sorted_enum = _freeze_enum(enum)
+    in_enum = enum.__contains__
+    enum_error = _error_format(
+        'The value "%s" for "%s" not in enumeration %s.',
+        _VALUE_SLOT, property_schema.name, sorted_enum)
+
+    def check_enum(value: Any, value_errors: list[str]) -> NoReturn:
+        if not in_enum(value):
+            value_errors.append(enum_error % (value,))
+
+    return [check_enum]
+
+
+def _compile_bound_checks(property_schema: 'OnticProperty') -> list[Callable]:
+    """Compile the min and max checks of a property.
+
+    Whether a bound is tested against the length or the value itself is
+    decided here from the property type.
+
+    :param property_schema: The property schema to utilize for validation.
+    :return: A list of the min and max checks that apply to the property.
+    """
+    name = property_schema.name
+    schema_type = property_schema.type
+    minimum = property_schema.min
+    maximum = property_schema.max
+    min_error = _error_format(
+        'The value of "%s" for "%s" fails min of %s.',
+        _VALUE_SLOT, name, minimum)
+    max_error = _error_format(
+        'The value of "%s" for "%s" fails max of %s.',
+        _VALUE_SLOT, name, maximum)
+    checks = []
+
+    if minimum:
+        if schema_type in BOUNDABLE_TYPES:
+            def check_min(value: Any, value_errors: list[str],
+                          _len: Callable = len) -> NoReturn:
+                if _len(value) < minimum:
+                    value_errors.append(min_error % (value,))
+            checks.append(check_min)
+        elif schema_type in COMPARABLE_TYPES:
+            def check_min(value: Any, value_errors: list[str]) -> NoReturn:
+                if value < minimum:
+                    value_errors.append(min_error % (value,))
+            checks.append(check_min)
+
+    if maximum:
+        if schema_type in BOUNDABLE_TYPES:
+            def check_max(value: Any, value_errors: list[str],
+                          _len: Callable = len) -> NoReturn:
+                if _len(value) > maximum:
+                    value_errors.append(max_error % (value,))
+            checks.append(check_max)
+        elif schema_type in COMPARABLE_TYPES:
+            def check_max(value: Any, value_errors: list[str]) -> NoReturn:
+                if value > maximum:
+                    value_errors.append(max_error % (value,))
+            checks.append(check_max)
+
+    return checks
+
+
+def _compile_regex_checks(property_schema: 'OnticProperty') -> list[Callable]:
+    """Compile the regex check of a non-collection property.
+
+    :param property_schema: The property schema to utilize for validation.
+    :return: A list holding the regex check, or empty if it does not apply.
+    """
+    regex = property_schema.regex
+    if not regex or property_schema.type is not str:
+        return []
+    match = _compile_regex(regex).match
+    regex_error = _error_format(
+        'Value "%s" for %s does not meet regex: %s',
+        _VALUE_SLOT, property_schema.name, regex)
+
+    def check_regex(value: str, value_errors: list[str]) -> NoReturn:
+        if value != '' and not match(value):
+            value_errors.append(regex_error % (value,))
+
+    return [check_regex]
+
+
+def _compile_member_checks(property_schema: 'OnticProperty') -> list[Callable]:
+    """Compile the member checks of a list or set property.
+
+    :param property_schema: The property schema to utilize for validation.
+    :return: A list holding the member check, or empty if there are no
+        member settings or the collection is not a list or set.
+    """
+    name = property_schema.name
+    enum = property_schema.enum
+    member_type = property_schema.member_type
+    regex = property_schema.regex
+    member_min = property_schema.member_min
+    member_max = property_schema.member_max
+
+    if property_schema.type not in {list, set}:
+        return []
+
+    member_validators = []
+    check_type = check_min = check_max = None
+
+    if enum:
+        enum, sorted_enum = _freeze_enum(enum)
+        in_enum = enum.__contains__
+        enum_error = _error_format(
+            'The value "%s" for "%s" not in enumeration %s.',
+            _VALUE_SLOT, name, sorted_enum)
+
+        def check_enum(member: Any, value_errors: list[str]) -> NoReturn:
+            if not in_enum(member):
+                value_errors.append(enum_error % (member,))
+        member_validators.append(check_enum)
+
+    if member_type:
+        type_error = _error_format(
+            'The value "%s" for "%s" is not of type "%s".',
+            _VALUE_SLOT, name, member_type)
+
+        def check_type(member: Any, value_errors: list[str],
+                       _type: Callable = type,
+                       _isinstance: Callable = isinstance) -> NoReturn:
+            if (_type(member) is not member_type and
+                    not _isinstance(member, member_type)):
+                value_errors.append(type_error % (member,))
+        member_validators.append(check_type)
+
+    if regex and member_type == str:
+        match = _compile_regex(regex).match
+        regex_error = _error_format(
+            'Value "%s" for "%s" does not meet regex: %s',
+            _VALUE_SLOT, name, regex)
+
+        def check_regex(member: str, value_errors: list[str]) -> NoReturn:
+            if not match(member):
+                value_errors.append(regex_error % (member,))
+        member_validators.append(check_regex)
+
+    if member_min:
+        if member_type is str:
+            min_error = _error_format(
+                'The value of "%s" for "%s" fails min length of %s.',
+                _VALUE_SLOT, name, member_min)
+
+            def check_min(member: str, value_errors: list[str],
+                          _len: Callable = len) -> NoReturn:
+                if _len(member) < member_min:
+                    value_errors.append(min_error % (member,))
+            member_validators.append(check_min)
+        elif member_type in COMPARABLE_TYPES:
+            min_error = _error_format(
+                'The value of "%s" for "%s" fails min size of %s.',
+                _VALUE_SLOT, name, member_min)
+
+            def check_min(member: Any, value_errors: list[str]) -> NoReturn:
+                if member < member_min:
+                    value_errors.append(min_error % (member,))
+            member_validators.append(check_min)
+
+    if member_max:
+        if member_type is str:
+            max_error = _error_format(
+                'The value of "%s" for "%s" fails max length of %s.',
+                _VALUE_SLOT, name, member_max)
+
+            def check_max(member: str, value_errors: list[str],
+                          _len: Callable = len) -> NoReturn:
+                if _len(member) > member_max:
+                    value_errors.append(max_error % (member,))
+            member_validators.append(check_max)
+        elif member_type in COMPARABLE_TYPES:
+            max_error = _error_format(
+                'The value of "%s" for "%s" fails max size of %s.',
+                _VALUE_SLOT, name, member_max)
+
+            def check_max(member: Any, value_errors: list[str]) -> NoReturn:
+                if member > member_max:
+                    value_errors.append(max_error % (member,))
+            member_validators.append(check_max)
+
+    if not member_validators:
+        return []
+
+    # Once every member is known to be of member_type, the type check
+    # cannot fail and is left out of the member loop.
+    typed_validators = [member_validator
+                        for member_validator in member_validators
+                        if member_validator is not check_type]
+
+    # For totally ordered members, the member bounds can then be tested for
+    # the whole collection with the builtin min and max, leaving the bound
+    # checks out of the loop as well.
+    unbounded_validators = [member_validator
+                            for member_validator in typed_validators
+                            if member_validator not in (check_min, check_max)]
+    has_bounds = (member_type in _ORDERED_MEMBER_TYPES and
+                  len(unbounded_validators) < len(typed_validators))
+    member_sizes = functools.partial(map, len) if member_type is str else iter
+
+    def within_bounds(value: Any) -> bool:
+        try:
+            return ((check_min is None or
+                     min(member_sizes(value)) >= member_min) and
+                    (check_max is None or
+                     max(member_sizes(value)) <= member_max))
+        except TypeError:
+            # Members that cannot be compared with each other, such as a
+            # date and a datetime, are left to the member loop.
+            return False
+
+    def check_members(value: Any, value_errors: list[str],
+                      _all: Callable = all,
+                      _isinstance: Callable = isinstance) -> NoReturn:
+        validators = member_validators
+        if member_type and _all(map(_isinstance, value,
+                                    repeat(member_type))):
+            validators = typed_validators
+            if has_bounds and value and within_bounds(value):
+                validators = unbounded_validators
+        if validators:
+            for member in value:
+                for member_validator in validators:
+                    member_validator(member, value_errors)
+
+    return [check_members]
+
+
+#: The member types whose bounds are tested with the builtin min and max.
+#: Members of these types are totally ordered, so the smallest and largest
+#: members are within the bounds only if every member is.
+_ORDERED_MEMBER_TYPES = {date, datetime, float, int, str, time}
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_regex(regex: str) -> re.Pattern:
+    """Compile a regex setting, caching the compiled pattern.
+
+    :param regex: The regex setting of a property schema.
+    :return: The compiled pattern.
+    """
+    return re.compile(regex)
+
+
+#: Marks the argument of *_error_format* that is filled in on failure.
+_VALUE_SLOT = object()
+
+
+def _error_format(template: str, *args: Any) -> str:
+    """Fill in the fixed arguments of an error message template.
+
+    The arguments known when a validator is compiled are formatted into the
+    message once. The placeholder given as *_VALUE_SLOT* is kept, so the
+    result is formatted with the failing value as a single element tuple.
+
+    :param template: The error message template, with a %s for each
+        argument.
+    :param args: The arguments of the template, with *_VALUE_SLOT* in place
+        of the failing value.
+    :return: The error message format for the failing value.
+    """
+    return template % tuple(
+        '%s' if arg is _VALUE_SLOT else str(arg).replace('%', '%%')
+        for arg in args)
+
+
+def _freeze_enum(enum: (set, tuple)) -> tuple[(frozenset, tuple), list[Any]]:
+    """Prepare an enum setting for use by a compiled check.
+
+    :param enum: The enum setting of a property schema.
+    :return: The enum as a frozenset, if it was given as a set, and the
+        sorted list of the enum members used in error messages.
+    """
+    sorted_enum = _generate_sorted_list(enum)
+    if isinstance(enum, set):
+        enum = frozenset(enum)
+    return enum, sorted_enum
+
+
 def _generate_sorted_list(some_collection: list[Any]) -> list[Any]:
     """Attempt to generate a sorted list from a collection.
 
@@ -220,13 +220,14 @@ after the table.
     that the value is not more than the maximum.
 
 """
-from typing import NoReturn, Any
+from typing import Any, Callable, NoReturn
 
+from ontic import core
 from ontic import meta
 from ontic import validation_exception
 
 
-class OnticProperty(meta.Meta):
+class OnticProperty(meta.Meta, core.VersionedCore):
     """A class to define a schema for a property."""
 
     ONTIC_SCHEMA = meta.Meta({
@@ -376,6 +377,9 @@ class OnticProperty(meta.Meta):
         }),
     })
 
+    #: The schema and the compiled validators of its settings.
+    _ONTIC_VALIDATORS = None
+
     def __init__(self, *args, **kwargs):
         super(OnticProperty, self).__init__(*args, **kwargs)
 
@@ -490,17 +494,15 @@ def validate_property(
 
     value_errors = []
 
-    for property_schema in ontic_property.get_schema().values():
-        property_value = ontic_property.get(property_schema.name, None)
+    for setting_name, validator in _setting_validators(type(ontic_property)):
+        property_value = ontic_property.get(setting_name, None)
 
         # todo: raul - for now skip validating compound schemas.
         if (isinstance(property_value, type) and
                 issubclass(property_value, meta.Meta)):
             continue
 
-        value_errors.extend(
-            meta.validate_value(
-                property_schema, property_value))
+        validator(property_value, value_errors)
 
     if value_errors and raise_validation_exception:
         raise validation_exception.ValidationException(value_errors)
@@ -508,6 +510,29 @@ def validate_property(
     return value_errors
 
 
+def _setting_validators(
+        property_type: type[OnticProperty]
+) -> tuple[tuple[str, Callable], ...]:
+    """Get the compiled setting validators of an :class:`OnticProperty` type.
+
+    The validators are compiled from the schema on first use and kept on
+    the type. They are compiled again if *ONTIC_SCHEMA* is replaced.
+
+    :param property_type: The :class:`OnticProperty` class whose validators
+        are required.
+    :return: A tuple of (setting name, validator) entries in schema order.
+    """
+    schema = property_type.get_schema()
+    compiled = property_type._ONTIC_VALIDATORS
+    if compiled is None or compiled[0] is not schema:
+        validators = tuple(
+            (setting.name, meta.compile_validator(setting))
+            for setting in schema.values())
+        compiled = (schema, validators)
+        property_type._ONTIC_VALIDATORS = compiled
+    return compiled[1]
+
+
 def _perfect_type_setting(ontic_property: 'OnticProperty') -> None:
     """Perfect the type setting for a given candidate property schema."""
     if ontic_property.type is None:
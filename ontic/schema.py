@@ -60,7 +60,7 @@ from ontic import property
 from ontic.validation_exception import ValidationException
 
 
-class Schema(core.Core):
+class Schema(core.VersionedCore):
     """The type definition for a schema object.
 
     The **Schema** contains a dictionary of property field names and
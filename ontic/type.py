@@ -49,12 +49,15 @@ with the use of the :meth:`create_ontic_type` function.
     3
 
 """
-from copy import deepcopy
-from typing import NoReturn
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, NoReturn
 
 import ontic
 from ontic import meta
-from ontic.meta import Meta, COLLECTION_TYPES, TYPE_MAP
+from ontic.core import _current_version, _version_of, fast_deepcopy
+from ontic.meta import Meta, COLLECTION_TYPES
 from ontic.schema import Schema
 from ontic.validation_exception import ValidationException
 
@@ -65,6 +68,18 @@ class OnticType(Meta):
     The **OnticType** provides the schema management functionality to a
     derived **Ontic** type instance.
     """
+    #: The schema, its version and the property validators compiled from it.
+    _ONTIC_VALIDATORS = None
+
+    #: The schema, its version and the property defaults prepared from it.
+    _ONTIC_DEFAULTS = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Prepare the validators and defaults of a class defined schema."""
+        super().__init_subclass__(**kwargs)
+        if 'ONTIC_SCHEMA' in cls.__dict__:
+            _property_validators(cls)
+            _property_defaults(cls)
 
     def perfect(self) -> NoReturn:
         """Function to ensure complete attribute settings for a given object.
@@ -127,6 +142,14 @@ def create_ontic_type(name: str, schema: (dict, Schema)) -> OnticType:
         schema_instance = Schema(prop={'type':'int'})
         MyType = create_ontic_type('MyType', schema_instance)
 
+    The schema is compiled into the validators and defaults for the type
+    when it is created. They are compiled again if the schema is changed.
+
+    Recently created types are cached, so calling *create_ontic_type* again
+    with the same name and an equal dict schema, or the same
+    :class:`ontic.Schema` instance, returns the type already created, unless
+    the schema of that type has since been replaced or changed.
+
     :param name: The name to apply to the created class, with
         :class:`OnticType` as parent.
     :param schema: A representation of the schema in dictionary format.
@@ -141,16 +164,74 @@ def create_ontic_type(name: str, schema: (dict, Schema)) -> OnticType:
     if not isinstance(schema, dict):
         raise ValueError('The schema must be a dict or SchemaType.')
 
+    try:
+        cache_key = (name, _freeze(schema))
+    except TypeError:
+        # The schema holds an unhashable value, so it cannot be cached.
+        cache_key = None
+    if cache_key is not None:
+        with _TYPE_CACHE_LOCK:
+            cached = _TYPE_CACHE.get(cache_key)
+            if cached is not None:
+                _TYPE_CACHE.move_to_end(cache_key)
+        # A type whose schema was replaced or changed is not reused. A type
+        # made from a Schema given by the caller is only reused for that
+        # same Schema, as the caller may go on to change it.
+        if (cached is not None and cached[0].ONTIC_SCHEMA is cached[1] and
+                (cached[1] is schema or not isinstance(schema, Schema)) and
+                _schema_version(cached[1]) == cached[2]):
+            return cached[0]
+
     ontic_type = type(name, (OnticType,), dict())
 
     if not isinstance(schema, Schema):
         schema = Schema(schema)
 
     ontic_type.ONTIC_SCHEMA = schema
+    _property_validators(ontic_type)
+    _property_defaults(ontic_type)
+
+    if cache_key is not None:
+        with _TYPE_CACHE_LOCK:
+            _TYPE_CACHE[cache_key] = (
+                ontic_type, schema, _schema_version(schema))
+            if len(_TYPE_CACHE) > _TYPE_CACHE_SIZE:
+                _TYPE_CACHE.popitem(last=False)
 
     return ontic_type
 
 
+#: The number of types kept by the create_ontic_type cache.
+_TYPE_CACHE_SIZE = 256
+
+#: Types made by create_ontic_type with the schema each was created with and
+#: its version, keyed by the type name and the frozen schema definition. The
+#: least recently used type is dropped when the cache is full.
+_TYPE_CACHE = OrderedDict()
+
+#: Serializes the updates of the create_ontic_type cache.
+_TYPE_CACHE_LOCK = threading.Lock()
+
+
+def _freeze(value: object) -> object:
+    """Convert a schema definition into a hashable equivalent.
+
+    The type of each value is kept, so that equal values of different types,
+    such as 1 and True, do not produce the same result.
+
+    :param value: The schema definition, or a value within it.
+    :return: A hashable representation of *value*.
+    """
+    if isinstance(value, dict):
+        return type(value), frozenset(
+            (key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze(item) for item in value)
+    return type(value), value
+
+
 def perfect_object(the_object: OnticType) -> NoReturn:
     """Function to ensure complete attribute settings for a given object.
 
@@ -169,26 +250,20 @@ def perfect_object(the_object: OnticType) -> NoReturn:
     if not isinstance(the_object, OnticType):
         raise ValueError('"the_object" must be OnticType type.')
 
-    schema = the_object.get_schema()
+    property_names, property_defaults = _property_defaults(type(the_object))
 
-    extra_properties = set(the_object.keys()) - set(schema.keys())
-    for property_name in extra_properties:
+    for property_name in the_object.keys() - property_names:
         del the_object[property_name]
 
-    for property_name, property_schema in schema.items():
-        if property_name not in the_object:
-            the_object[property_name] = None
-        value = the_object[property_name]
-
-        if value is None and property_schema.default is not None:
-            if TYPE_MAP.get(property_schema.type) in COLLECTION_TYPES:
-                value = the_object[property_name] = deepcopy(
-                    property_schema.default)
-            elif issubclass(property_schema.type, OnticType):
-                value = the_object[property_name] = deepcopy(
-                    property_schema.default)
+    for property_name, default, copy_default in property_defaults:
+        value = the_object.get(property_name, None)
+
+        if value is None:
+            if copy_default:
+                value = fast_deepcopy(default)
             else:
-                value = the_object[property_name] = property_schema.default
+                value = default
+            the_object[property_name] = value
 
         if value is not None and isinstance(value, OnticType):
             value.perfect()
@@ -217,10 +292,20 @@ def validate_object(
             'Validation can only support validation of objects derived from '
             'ontic.ontic_type.OnticType.')
 
+    _, property_validators, has_required = _property_validators(
+        type(the_object))
+
+    # An empty object is valid unless a property is required.
+    if not the_object and not has_required:
+        return []
+
     value_errors = []
 
-    for property_name in the_object.get_schema().keys():
-        value_errors.extend(validate_value(property_name, the_object, False))
+    for property_name, required, validator in property_validators:
+        value = the_object.get(property_name, None)
+        # An unset optional property has nothing to validate.
+        if value is not None or required:
+            validator(value, value_errors)
 
     if value_errors and raise_validation_exception:
         raise ValidationException(value_errors)
@@ -252,6 +337,36 @@ def validate_value(
         *raise_validation_exception* is
         set to False.
     """
+    if (type(property_name) is not str or not property_name or
+            not isinstance(ontic_object, OnticType)):
+        _check_validate_value_args(property_name, ontic_object)
+
+    value_errors = []
+
+    validator = _property_validators(type(ontic_object))[0].get(property_name)
+    if validator is None:
+        raise ValueError(
+            '"%s" is not a recognized property.' % property_name)
+
+    validator(ontic_object.get(property_name, None), value_errors)
+
+    if value_errors and raise_validation_exception:
+        raise ValidationException(value_errors)
+
+    return value_errors
+
+
+def _check_validate_value_args(property_name: str,
+                               ontic_object: OnticType) -> NoReturn:
+    """Raise the error for the first invalid argument of *validate_value*.
+
+    :param property_name: The property name given to *validate_value*.
+    :param ontic_object: The object given to *validate_value*.
+    :raises ValueError: If *property_name* is not provided or is not a valid
+        string.
+    :raises ValueError: If *ontic_object* is None, or not instance of
+        *OnticType*.
+    """
     if property_name is None:
         raise ValueError(
             '"property_name" is required, cannot be None.')
@@ -264,30 +379,152 @@ def validate_value(
         raise ValueError(
             '"ontic_object" must be OnticType or child type of OnticType.')
 
-    value_errors = []
 
-    property_schema = ontic_object.get_schema().get(property_name)
-    if property_schema is None:
-        raise ValueError(
-            '"%s" is not a recognized property.' % property_name)
+def _property_validators(
+        ontic_type: type[OnticType]
+) -> tuple[dict[str, Callable], tuple[tuple[str, bool, Callable], ...], bool]:
+    """Get the compiled property validators of an **Ontic** type.
+
+    The validators are compiled from the schema on first use and kept on
+    the type, see :func:`_prepared`.
+
+    :param ontic_type: The :class:`OnticType` class whose validators are
+        required.
+    :return: The validator for each property keyed by property name, the
+        same validators as a tuple of (property name, required, validator)
+        entries in schema order, and whether any property is required.
+    """
+    return _prepared(ontic_type, '_ONTIC_VALIDATORS', _compile_validators)
+
+
+def _compile_validators(
+        schema: Schema
+) -> tuple[dict[str, Callable], tuple[tuple[str, bool, Callable], ...], bool]:
+    """Compile the property validators of a schema.
+
+    :param schema: The schema whose property validators are compiled.
+    :return: The validators as described by :func:`_property_validators`.
+    """
+    # Names are interned to match the keys set by attribute assignment
+    # and the names given as literals to validate_value.
+    validators = {
+        sys.intern(property_name): _compile_property_validator(
+            property_name, property_schema)
+        for property_name, property_schema in schema.items()}
+    entries = tuple(
+        (property_name, bool(schema[property_name].required), validator)
+        for property_name, validator in validators.items())
+    has_required = any(required for _, required, _ in entries)
+    return validators, entries, has_required
+
+
+def _prepared(ontic_type: type[OnticType],
+              attribute: str,
+              prepare: Callable[[Schema], object]) -> object:
+    """Get the data prepared from the schema of an **Ontic** type.
+
+    The data is prepared on first use and kept on the type in *attribute*,
+    along with the schema and its version. It is prepared again if
+    *ONTIC_SCHEMA* is replaced, or if the schema or one of its properties
+    has been changed since. Changes made to a value held by a property
+    setting, such as adding to an enum set, are not detected.
+
+    :param ontic_type: The :class:`OnticType` class whose data is required.
+    :param attribute: The name of the class attribute that keeps the data.
+    :param prepare: The function that prepares the data from a schema.
+    :return: The data prepared from the current schema.
+    """
+    schema = ontic_type.get_schema()
+    # The current version is read before the schema is examined, so a change
+    # made meanwhile is found by the next call.
+    current = _current_version()
+    prepared = getattr(ontic_type, attribute)
+    if (prepared is None or prepared[0] is not schema or
+            prepared[1] != current):
+        version = _schema_version(schema)
+        if (prepared is None or prepared[0] is not schema or
+                prepared[2] != version):
+            prepared = (schema, current, version, prepare(schema))
+        else:
+            prepared = (schema, current, version, prepared[3])
+        setattr(ontic_type, attribute, prepared)
+    return prepared[3]
+
+
+def _schema_version(schema: Schema) -> int:
+    """Get the latest version stamp of a schema and its properties.
+
+    :param schema: The schema whose version is required.
+    :return: The latest version stamp of *schema* and its property values.
+    """
+    return max(_version_of(schema),
+               max(map(_version_of, schema.values()), default=0))
 
-    value = ontic_object.get(property_name, None)
 
-    value_errors.extend(
-        meta.validate_value(property_schema, value))
+def _property_defaults(
+        ontic_type: type[OnticType]
+) -> tuple[frozenset[str], tuple[tuple[str, object, bool], ...]]:
+    """Get the property defaults of an **Ontic** type for perfecting.
+
+    The defaults are prepared from the schema on first use and kept on the
+    type, see :func:`_prepared`.
+
+    :param ontic_type: The :class:`OnticType` class whose defaults are
+        required.
+    :return: The set of property names, and a tuple of (property name,
+        default, copy default) entries in schema order. Copy default is True
+        if the default is to be deep copied for each object.
+    """
+    return _prepared(ontic_type, '_ONTIC_DEFAULTS', _prepare_defaults)
+
+
+def _prepare_defaults(
+        schema: Schema
+) -> tuple[frozenset[str], tuple[tuple[str, object, bool], ...]]:
+    """Prepare the property defaults of a schema.
+
+    :param schema: The schema whose property defaults are prepared.
+    :return: The defaults as described by :func:`_property_defaults`.
+    """
+    property_defaults = []
+    for property_name, property_schema in schema.items():
+        # The type setting is resolved to a type, or None, when the
+        # property schema is perfected.
+        schema_type = property_schema.type
+        copy_default = property_schema.default is not None and (
+            schema_type in COLLECTION_TYPES or (
+                schema_type is not None and
+                issubclass(schema_type, OnticType)))
+        property_defaults.append(
+            (property_name, property_schema.default, copy_default))
+    return frozenset(schema.keys()), tuple(property_defaults)
+
+
+def _compile_property_validator(
+        property_name: str,
+        property_schema: 'ontic.OnticProperty') -> Callable:
+    """Compile the validator for a single property of an **Ontic** type.
+
+    :param property_name: The name of the property.
+    :param property_schema: The schema of the property.
+    :return: A validator that is called with the property value and the
+        list that collects the errors found.
+    """
+    validator = meta.compile_validator(property_schema)
 
     # if a value is an OnticType, then have it self validate.
     is_ontic_type = (property_schema.type is not None and
                      issubclass(property_schema.type, OnticType))
-    child_errors = None
-    if is_ontic_type and value is not None:
-        child_errors = value.validate(raise_validation_exception=False)
-    if child_errors:
-        error_msg = 'The child property %s, has errors:: %s' % (
-            property_name, ' || '.join(child_errors))
-        value_errors.append(error_msg)
-
-    if value_errors and raise_validation_exception:
-        raise ValidationException(value_errors)
-
-    return value_errors
+    if not is_ontic_type:
+        return validator
+
+    def validate_child(value: OnticType, value_errors: list[str]) -> NoReturn:
+        validator(value, value_errors)
+        if value is not None:
+            child_errors = value.validate(raise_validation_exception=False)
+            if child_errors:
+                error_msg = 'The child property %s, has errors:: %s' % (
+                    property_name, ' || '.join(child_errors))
+                value_errors.append(error_msg)
+
+    return validate_child
@@ -3,7 +3,7 @@ from copy import copy, deepcopy
 
 from test import utils
 
-from ontic.core import Core
+from ontic.core import Core, fast_deepcopy
 
 
 class SubType(Core):
@@ -105,3 +105,60 @@ class OnticCoreTest(utils.BaseTestCase):
         self.assertIsNot(sub_copy.dict_prop, sub_object.dict_prop)
         self.assertIsNot(sub_copy.dict_prop['list_key'],
                          sub_object.dict_prop['list_key'])
+
+    def test_fast_deepcopy(self):
+        """Ensure that fast_deepcopy copies nested containers."""
+        original = {
+            'list_key': [4, 'fish', {'key1': 'red'}],
+            'set_key': {1, 2},
+            'tuple_key': ([5], 'cat'),
+            'core_key': SubType(list_prop=[6]),
+            'empty_key': [],
+        }
+
+        # Execute the test.
+        the_copy = fast_deepcopy(original)
+
+        # Validate the test results.
+        self.assertDictEqual(original, the_copy)
+        self.assertIsNot(original, the_copy)
+        self.assertIsNot(original['list_key'], the_copy['list_key'])
+        self.assertIsNot(original['list_key'][2], the_copy['list_key'][2])
+        self.assertIsNot(original['set_key'], the_copy['set_key'])
+        self.assertIsNot(original['tuple_key'][0], the_copy['tuple_key'][0])
+        self.assertIsNot(original['empty_key'], the_copy['empty_key'])
+
+        # Empty containers come back as new containers of the same type.
+        for empty in ([], {}, set()):
+            with self.subTest(empty=empty):
+                empty_copy = fast_deepcopy(empty)
+                self.assertIs(type(empty), type(empty_copy))
+                self.assertEqual(empty, empty_copy)
+                self.assertIsNot(empty, empty_copy)
+        self.assertEqual((), fast_deepcopy(()))
+        self.assertIsInstance(the_copy['core_key'], SubType)
+        self.assertIsNot(original['core_key'].list_prop,
+                         the_copy['core_key'].list_prop)
+
+    def test_deepcopy_references(self):
+        """Ensure deepcopy keeps shared and self references of Core."""
+        shared = [1, [2]]
+        looped = []
+        looped.append(looped)
+        sub_object = SubType(list_prop=shared, other_prop=shared,
+                             looped_prop=looped)
+        sub_object.self_prop = sub_object
+
+        # Execute the test.
+        sub_copy = deepcopy(sub_object)
+
+        # Validate the test results.
+        self.assertIsNot(sub_object.list_prop, sub_copy.list_prop)
+        self.assertIs(sub_copy.list_prop, sub_copy.other_prop)
+        self.assertIsNot(sub_object.looped_prop, sub_copy.looped_prop)
+        self.assertIs(sub_copy.looped_prop, sub_copy.looped_prop[0])
+        self.assertIs(sub_copy, sub_copy.self_prop)
+
+        # The memo is shared with an enclosing copy.deepcopy.
+        outer_copy = deepcopy([sub_object, shared])
+        self.assertIs(outer_copy[0].list_prop, outer_copy[1])
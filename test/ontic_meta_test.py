@@ -3,6 +3,7 @@ from copy import copy, deepcopy
 
 from test import utils
 
+from ontic import OnticProperty, meta
 from ontic.meta import Meta
 
 
@@ -105,3 +106,34 @@ class OnticMetaTest(utils.BaseTestCase):
         self.assertIsNot(sub_copy.dict_prop, sub_object.dict_prop)
         self.assertIsNot(sub_copy.dict_prop['list_key'],
                          sub_object.dict_prop['list_key'])
+
+
+class CompileValidatorTest(utils.BaseTestCase):
+    """compile_validator test cases."""
+
+    def test_compiled_errors_match_validate_value(self):
+        """Ensure compiled validators report the validate_value errors."""
+        cases = (
+            ({'type': 'int', 'required': True}, None),
+            ({'type': 'int'}, 'not an int'),
+            ({'enum': {'a', 'b'}}, 'c'),
+            ({'type': 'str', 'min': 3, 'max': 4, 'regex': '^b+'}, 'ab'),
+            ({'type': 'int', 'min': 3, 'enum': {1, 5}}, 2),
+            ({'type': 'list', 'max': 1, 'member_type': 'str',
+              'member_min': 2, 'regex': '^b+'}, ['bb', 'a']),
+            ({'type': 'set', 'member_type': 'int', 'member_max': 4,
+              'enum': {1, 5}}, {5}),
+            ({'type': 'dict', 'min': 2}, {'key': 'value'}),
+            ({'type': 'list', 'member_type': 'tuple', 'member_min': (0,),
+              'enum': {(1, 2)}}, [(1, 'a'), (1, 2)]),
+        )
+        for settings, value in cases:
+            with self.subTest(settings=settings, value=value):
+                property_schema = OnticProperty(name='prop', **settings)
+                compiled_errors = []
+                meta.compile_validator(property_schema)(
+                    value, compiled_errors)
+                self.assertTrue(compiled_errors)
+                self.assertListEqual(
+                    meta.validate_value(property_schema, value),
+                    compiled_errors)
@@ -82,12 +82,12 @@ class OnticPropertyTest(BaseTestCase):
             }
         )
 
-        self.assertRaisesRegex(
-            ValidationException,
-            r'The value for "dudete" is not of type "<class \'int\'>": some string',
-            ontic_property.validate_value,
-            'some string',
-            raise_validation_exception=True)
+        with self.assertRaisesRegex(
+                ValidationException,
+                r'The value for "dudete" is not of type '
+                r'"<class \'int\'>": some string'):
+            ontic_property.validate_value('some string',
+                                          raise_validation_exception=True)
 
     def test_dynamic_access(self):
         """Ensure OnticProperty property access as dict and attribute."""
@@ -139,20 +139,20 @@ class OnticPropertyTest(BaseTestCase):
 
         bad_schema_test_case = {'type': 'UNDEFINED'}
 
-        self.assertRaisesRegex(
-            ValueError,
-            r"""Illegal type declaration: UNDEFINED""",
-            OnticProperty, bad_schema_test_case)
+        with self.assertRaisesRegex(
+                ValueError,
+                r"""Illegal type declaration: UNDEFINED"""):
+            OnticProperty(bad_schema_test_case)
 
         class UNDEFINED(object):
             pass
 
         bad_schema_test_case = {'type': UNDEFINED}
 
-        self.assertRaisesRegex(
-            ValueError,
-            r"""Illegal type declaration: %s""" % UNDEFINED,
-            OnticProperty, bad_schema_test_case)
+        with self.assertRaisesRegex(
+                ValueError,
+                r"""Illegal type declaration: %s""" % UNDEFINED):
+            OnticProperty(bad_schema_test_case)
 
     def test_property_type_validate(self):
         """Test OnticProperty.validate method."""
@@ -163,7 +163,8 @@ class OnticPropertyTest(BaseTestCase):
         self.assertEqual([], property_schema.validate())
 
         property_schema.type = '__WRONG__'
-        self.assertRaises(ValidationException, property_schema.validate)
+        with self.assertRaises(ValidationException):
+            property_schema.validate()
 
     def test_property_schema_perfect(self):
         """Test OnticProperty.perfect method."""
@@ -352,15 +353,15 @@ class PerfectSchemaPropertyTestCase(BaseTestCase):
     def test_bad_perfect_schema_property(self):
         """Validate error handling for bad schemas passed to
         perfect_property."""
-        self.assertRaisesRegex(
-            ValueError,
-            '"ontic_property" must be provided.',
-            perfect_property, None)
+        with self.assertRaisesRegex(
+                ValueError,
+                '"ontic_property" must be provided.'):
+            perfect_property(None)
 
-        self.assertRaisesRegex(
-            ValueError,
-            '"ontic_property" must be OnticProperty type.',
-            perfect_property, {})
+        with self.assertRaisesRegex(
+                ValueError,
+                '"ontic_property" must be OnticProperty type.'):
+            perfect_property({})
 
 
 class ValidateSchemaProperty(BaseTestCase):
@@ -368,15 +369,15 @@ class ValidateSchemaProperty(BaseTestCase):
 
     def test_bad_validate_schema_property_call(self):
         """Test bad use cases of validate_property_type function call."""
-        self.assertRaisesRegex(
-            ValueError,
-            '"ontic_property" must be provided.',
-            validate_property, None, list())
+        with self.assertRaisesRegex(
+                ValueError,
+                '"ontic_property" must be provided.'):
+            validate_property(None, list())
 
-        self.assertRaisesRegex(
-            ValueError,
-            '"ontic_property" must be OnticProperty type.',
-            validate_property, dict(), list())
+        with self.assertRaisesRegex(
+                ValueError,
+                '"ontic_property" must be OnticProperty type.'):
+            validate_property(dict(), list())
 
     def test_validate_schema_property_exception(self):
         """Test validate_schema validation exception handling."""
@@ -384,10 +385,11 @@ class ValidateSchemaProperty(BaseTestCase):
         invalid_property_schema.type = 'UNKNOWN'
 
         self.maxDiff = None
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value "UNKNOWN" for "type" not in enumeration \[.*\].""",
-            validate_property, invalid_property_schema)
+        with self.assertRaisesRegex(
+                ValidationException,
+                r"""The value "UNKNOWN" for "type" not in """
+                r"""enumeration \[.*\]."""):
+            validate_property(invalid_property_schema)
 
         value_errors = validate_property(
             invalid_property_schema,
@@ -403,12 +405,12 @@ class ValidateSchemaProperty(BaseTestCase):
         invalid_property_schema.member_type = 'UNKNOWN'
 
         self.maxDiff = None
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value "UNKNOWN" for "member_type" not in enumeration \[<class 'bool'>, <class 'complex'>, """
-            r"""<class 'datetime.date'>, <class 'datetime.datetime'>, <class 'datetime.time'>, <class 'dict'>"""
-            r""", <class 'float'>, <class 'int'>, <class 'list'>, <class 'set'>, <class 'str'>, <class 'tuple'>, None\].""",
-            validate_property, invalid_property_schema)
+        with self.assertRaisesRegex(
+                ValidationException,
+                r"""The value "UNKNOWN" for "member_type" not in enumeration \[<class 'bool'>, <class 'complex'>, """
+                r"""<class 'datetime.date'>, <class 'datetime.datetime'>, <class 'datetime.time'>, <class 'dict'>"""
+                r""", <class 'float'>, <class 'int'>, <class 'list'>, <class 'set'>, <class 'str'>, <class 'tuple'>, None\]."""):
+            validate_property(invalid_property_schema)
 
         value_errors = validate_property(
             invalid_property_schema,
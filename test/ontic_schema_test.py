@@ -241,14 +241,14 @@ class ValidateSchemaTestCase(BaseTestCase):
 
     def test_bad_validate_schema(self):
         """ValueError testing of validate_schema."""
-        self.assertRaisesRegex(
-            ValueError,
-            r""""ontic_schema" argument must be provided.""",
-            o_schema.validate_schema, None)
-        self.assertRaisesRegex(
-            ValueError,
-            r""""ontic_schema" argument must be of Schema type.""",
-            o_schema.validate_schema, "not a oschema")
+        with self.assertRaisesRegex(
+                ValueError,
+                r""""ontic_schema" argument must be provided."""):
+            o_schema.validate_schema(None)
+        with self.assertRaisesRegex(
+                ValueError,
+                r""""ontic_schema" argument must be of Schema type."""):
+            o_schema.validate_schema("not a oschema")
 
     def test_validate_schema(self):
         """Valid oschema testing of validate_schema."""
@@ -272,11 +272,11 @@ class ValidateSchemaTestCase(BaseTestCase):
         schema_instance = Schema()
         schema_instance.add(property_schema)
 
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value for "required" is not """
-            r"""of type "<class 'bool'>": UNDEFINED""",
-            o_schema.validate_schema, schema_instance)
+        with self.assertRaisesRegex(
+                ValidationException,
+                r"""The value for "required" is not """
+                r"""of type "<class 'bool'>": UNDEFINED"""):
+            o_schema.validate_schema(schema_instance)
 
         expected_errors_list = [
             """The value for "required" is not of """
@@ -376,12 +376,12 @@ class PerfectSchemaTestCase(BaseTestCase):
 
     def test_bad_perfect_schema(self):
         """Validate proper error handling in 'perfect_schema' method."""
-        self.assertRaisesRegex(
-            ValueError,
-            r""""ontic_schema" must be provided.""",
-            o_schema.perfect_schema, None)
-
-        self.assertRaisesRegex(
-            ValueError,
-            r""""ontic_schema" argument must be of Schema type.""",
-            o_schema.perfect_schema, {})
+        with self.assertRaisesRegex(
+                ValueError,
+                r""""ontic_schema" must be provided."""):
+            o_schema.perfect_schema(None)
+
+        with self.assertRaisesRegex(
+                ValueError,
+                r""""ontic_schema" argument must be of Schema type."""):
+            o_schema.perfect_schema({})
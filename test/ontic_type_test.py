@@ -1,4 +1,6 @@
 """Test the basic functionality of the base and core data types."""
+import re
+from copy import copy
 from datetime import date, time, datetime
 from typing import NoReturn
 
@@ -11,6 +13,115 @@ from ontic.schema import Schema
 from ontic.validation_exception import ValidationException
 from test.utils import BaseTestCase
 
+#: Type shared by the validation exception handling tests.
+_VALIDATE_CHECK_TYPE = o_type.create_ontic_type(
+    'ValidateCheck', Schema(some_attr={'type': 'int'}))
+
+#: Type used only for the validate_value argument checks.
+_BAD_VALIDATE_VALUE_TYPE = o_type.create_ontic_type(
+    'BadValidateValue', {'prop1': {'type': 'int'}})
+
+#: The (name, schema, expected error) cases of create_ontic_type arg checks.
+_CREATE_ARG_ERRORS = (
+    (None, {}, 'The string "name" argument is required.'),
+    ('SomeName', None, 'The schema dictionary is required.'),
+    ('SomeName', [], 'The schema must be a dict or SchemaType.'),
+)
+
+# Expected validation errors for the schema setting tests.
+_RX_REQUIRED = re.compile('The value for "some_property" is required.')
+_RX_ENUM = re.compile(
+    r"""The value "bad, bad, bad" for "enum_property" not in """
+    r"""enumeration """
+    r"""(\['some_value', 99\]|\[99, 'some_value'\])\.""")
+_RX_COLLECTION_ENUM = re.compile(
+    r'''The value "fish" for "enum_property" not in'''
+    r''' enumeration \['cat', 'dog'\].''')
+_RX_STR_MIN = re.compile(
+    'The value of "1" for "str_min_property" '
+    'fails min of 5.')
+_RX_INT_MIN = re.compile(
+    'The value of "5" for "int_min_property" '
+    'fails min of 10.')
+_RX_FLOAT_MIN = re.compile(
+    'The value of "15.0" for "float_min_property" '
+    'fails min of 20.')
+_RX_LIST_MIN = re.compile(
+    r"""The value of "\[\]" for "list_min_property" """
+    r"""fails min of 1.""")
+_RX_SET_MIN = re.compile(
+    r"""set\(\)" for "set_min_property" fails min of 1.""")
+_RX_DICT_MIN = re.compile(
+    'The value of "{}" for "dict_min_property" '
+    'fails min of 1.')
+_RX_DATE_MIN = re.compile('date_min_property" fails min of 2000-01-01.')
+_RX_TIME_MIN = re.compile(
+    'The value of "11:30:30" for "time_min_property" '
+    'fails min of 12:30:30.')
+_RX_DATETIME_MIN = re.compile(
+    'The value of "1999-01-01 11:30:30" for '
+    '"datetime_min_property" '
+    'fails min of 2000-01-01 12:30:30.')
+_RX_STR_MAX = re.compile(
+    'The value of "8 letters" for '
+    '"str_max_property" fails max of 5.')
+_RX_INT_MAX = re.compile(
+    'The value of "20" for "int_max_property" '
+    'fails max of 10.')
+_RX_FLOAT_MAX = re.compile(
+    'The value of "30.0" for "float_max_property" '
+    'fails max of 20.')
+_RX_LIST_MAX = re.compile(
+    r"""The value of "\['(one|two) item', '(one|two) item'\]" """
+    r"""for "list_max_property" fails max of 1.""")
+_RX_SET_MAX = re.compile(
+    r"""The value of "{'(one|two) item', '(two|one) item'}" """
+    r"""for "set_max_property" fails max of 1.""")
+_RX_DICT_MAX = re.compile(
+    r"""The value of """
+    r"""("{'some_key': 'one_item', 'another_key': 'two_item'}"|"""
+    r""""{'another_key': 'two_item', 'some_key': 'one_item'}")"""
+    r""" for "dict_max_property" fails max of 1.""")
+_RX_DATE_MAX = re.compile(
+    'The value of "2001-01-01" for '
+    '"date_max_property" fails max of 2000-01-01.')
+_RX_TIME_MAX = re.compile(
+    'The value of "13:30:30" for "time_max_property" '
+    'fails max of 12:30:30.')
+_RX_DATETIME_MAX = re.compile(
+    'The value of "2001-01-01 11:30:30" for '
+    '"datetime_max_property" '
+    'fails max of 2000-01-01 12:30:30.')
+
+#: The (property, bad value, expected error) cases of test_min_setting.
+_MIN_FAILURES = (
+    ('str_min_property', '1', _RX_STR_MIN),
+    ('int_min_property', 5, _RX_INT_MIN),
+    ('float_min_property', 15.0, _RX_FLOAT_MIN),
+    ('list_min_property', list(), _RX_LIST_MIN),
+    ('set_min_property', set(), _RX_SET_MIN),
+    ('dict_min_property', dict(), _RX_DICT_MIN),
+    ('date_min_property', date(1999, 1, 1), _RX_DATE_MIN),
+    ('time_min_property', time(11, 30, 30), _RX_TIME_MIN),
+    ('datetime_min_property', datetime(1999, 1, 1, 11, 30, 30),
+     _RX_DATETIME_MIN),
+)
+
+#: The (property, bad value, expected error) cases of test_max_setting.
+_MAX_FAILURES = (
+    ('str_max_property', '8 letters', _RX_STR_MAX),
+    ('int_max_property', 20, _RX_INT_MAX),
+    ('float_max_property', 30.0, _RX_FLOAT_MAX),
+    ('list_max_property', ['one item', 'two item'], _RX_LIST_MAX),
+    ('set_max_property', {'one item', 'two item'}, _RX_SET_MAX),
+    ('dict_max_property', {'some_key': 'one_item', 'another_key': 'two_item'},
+     _RX_DICT_MAX),
+    ('date_max_property', date(2001, 1, 1), _RX_DATE_MAX),
+    ('time_max_property', time(13, 30, 30), _RX_TIME_MAX),
+    ('datetime_max_property', datetime(2001, 1, 1, 11, 30, 30),
+     _RX_DATETIME_MAX),
+)
+
 
 class OnticTypeTest(BaseTestCase):
     """OnticType test cases."""
@@ -26,6 +137,23 @@ class OnticTypeTest(BaseTestCase):
         my_object.prop = 3
         self.assertDictEqual(expected_dict, my_object)
 
+    def test_class_defined_type(self) -> NoReturn:
+        """Ensure a class defined schema can be extended after definition."""
+        class ClassDefined(o_type.OnticType):
+            ONTIC_SCHEMA = Schema(prop={'type': 'int', 'default': 1})
+
+        ontic_object = ClassDefined()
+        ontic_object.perfect()
+        self.assertEqual(1, ontic_object.prop)
+        self.assertListEqual([], ontic_object.validate(False))
+
+        ClassDefined.ONTIC_SCHEMA.add(
+            OnticProperty(name='other', type='int', required=True))
+        self.assertListEqual(['The value for "other" is required.'],
+                             ClassDefined().validate(False))
+        ontic_object.perfect()
+        self.assertDictEqual({'prop': 1, 'other': None}, ontic_object)
+
     def test_dynamic_access(self) -> NoReturn:
         """OnticType property access as a Dict and an Attribute."""
         some_type = o_type.OnticType()
@@ -65,16 +193,16 @@ class OnticTypeTest(BaseTestCase):
 
         # Create the o_type
         my_type = o_type.create_ontic_type('RequireCheck', schema)
-        self.assertIsNotNone(o_type)
+        assert my_type is not None
 
         # Create object of o_type
         ontic_object = my_type()
 
         # Validate an empty object, which should cause ValueError
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value for "some_property" is required.',
-            ontic_object.validate)
+        with self.assertRaisesRegex(
+                ValidationException,
+                'The value for "some_property" is required.'):
+            ontic_object.validate()
 
         # Validate with data
         ontic_object.some_property = 'Something'
@@ -98,22 +226,18 @@ class CreateOnticTypeTestCase(BaseTestCase):
 
     def test_create_ontic_type_arg_errors(self):
         """Assert the create ontic o_type arg errors."""
-        self.assertRaisesRegex(
-            ValueError, 'The string "name" argument is required.',
-            o_type.create_ontic_type, name=None, schema=dict())
-        self.assertRaisesRegex(
-            ValueError, 'The schema dictionary is required.',
-            o_type.create_ontic_type, name='SomeName', schema=None)
-        self.assertRaisesRegex(
-            ValueError, 'The schema must be a dict.',
-            o_type.create_ontic_type, name='SomeName', schema=list())
+        for name, schema, message in _CREATE_ARG_ERRORS:
+            with self.subTest(message=message):
+                self.assert_error(ValueError, message,
+                                  o_type.create_ontic_type,
+                                  name=name, schema=schema)
 
     def test_create_ontic_type(self) -> NoReturn:
         """The most simple and basic dynamic Ontic."""
         # Test creation from raw dictionary.
         my_type = o_type.create_ontic_type('Simple', dict())
 
-        self.assertIsNotNone(my_type)
+        assert my_type is not None
 
         ontic_object = my_type()
         self.assert_dynamic_accessing(ontic_object)
@@ -122,27 +246,87 @@ class CreateOnticTypeTestCase(BaseTestCase):
         # Test creation using a Schema object.
         my_type = o_type.create_ontic_type('AnotherSimple', Schema())
 
-        self.assertIsNotNone(my_type)
+        assert my_type is not None
 
         ontic_object = my_type()
         self.assert_dynamic_accessing(ontic_object)
         self.assertIsInstance(ontic_object, my_type)
 
+    def test_create_ontic_type_cache(self) -> NoReturn:
+        """Ensure equal create_ontic_type calls return the same type."""
+        my_type = o_type.create_ontic_type(
+            'Cached', {'prop': {'type': 'int', 'enum': {1, 2}}})
+        self.assertIs(my_type, o_type.create_ontic_type(
+            'Cached', {'prop': {'type': 'int', 'enum': {2, 1}}}))
+
+        # A different name or schema creates a new type.
+        self.assertIsNot(my_type, o_type.create_ontic_type(
+            'OtherCached', {'prop': {'type': 'int', 'enum': {1, 2}}}))
+        self.assertIsNot(my_type, o_type.create_ontic_type(
+            'Cached', {'prop': {'type': 'int', 'enum': {1, 3}}}))
+
+        # A type whose schema was replaced is not returned again.
+        my_type.ONTIC_SCHEMA = Schema()
+        self.assertIsNot(my_type, o_type.create_ontic_type(
+            'Cached', {'prop': {'type': 'int', 'enum': {1, 2}}}))
+
+    def test_create_ontic_type_cache_changed_schema(self) -> NoReturn:
+        """Ensure a type whose schema was changed in place is not reused."""
+        my_type = o_type.create_ontic_type(
+            'Changed', {'prop': {'type': 'int'}})
+        my_type.ONTIC_SCHEMA.add(OnticProperty(name='other', type='int'))
+        new_type = o_type.create_ontic_type(
+            'Changed', {'prop': {'type': 'int'}})
+        self.assertIsNot(my_type, new_type)
+        self.assertSetEqual({'prop'}, set(new_type.ONTIC_SCHEMA))
+
+        # A passed in schema that is changed afterwards is not reused either.
+        schema = Schema(prop={'type': 'int'})
+        my_type = o_type.create_ontic_type('PassedIn', schema)
+        schema['prop'].max = 5
+        self.assertIsNot(my_type, o_type.create_ontic_type(
+            'PassedIn', Schema(prop={'type': 'int'})))
+
+    def test_create_ontic_type_cache_equal_schema(self) -> NoReturn:
+        """Ensure an equal Schema instance gets a type of its own."""
+        first_schema = Schema(prop={'type': 'int'})
+        second_schema = Schema(prop={'type': 'int'})
+        first_type = o_type.create_ontic_type('EqualSchema', first_schema)
+        second_type = o_type.create_ontic_type('EqualSchema', second_schema)
+        self.assertIsNot(first_type, second_type)
+        self.assertIs(second_schema, second_type.ONTIC_SCHEMA)
+        self.assertIs(second_type,
+                      o_type.create_ontic_type('EqualSchema', second_schema))
+
+        second_schema.add(
+            OnticProperty(name='other', type='int', required=True))
+        self.assertListEqual(['The value for "other" is required.'],
+                             second_type(prop=1).validate(False))
+        self.assertListEqual([], first_type(prop=1).validate(False))
+
+    def test_create_ontic_type_cache_size(self) -> NoReturn:
+        """Ensure the create_ontic_type cache is bounded."""
+        first_type = o_type.create_ontic_type('Bounded', {})
+        for index in range(o_type._TYPE_CACHE_SIZE):
+            o_type.create_ontic_type('Bounded%d' % index, {})
+        self.assertEqual(o_type._TYPE_CACHE_SIZE, len(o_type._TYPE_CACHE))
+        self.assertIsNot(first_type, o_type.create_ontic_type('Bounded', {}))
+
 
 class PerfectObjectTestCase(BaseTestCase):
     """Test ontic_type.perfect_object method."""
 
     def test_bad_perfect_usage(self) -> NoReturn:
         """Ensure handling of bad arguments to perfect)_object method."""
-        self.assertRaisesRegex(
-            ValueError,
-            r'"the_object" must be provided.',
-            o_type.perfect_object, None)
+        with self.assertRaisesRegex(
+                ValueError,
+                r'"the_object" must be provided.'):
+            o_type.perfect_object(None)
 
-        self.assertRaisesRegex(
-            ValueError,
-            r'"the_object" must be OnticType type.',
-            o_type.perfect_object, {})
+        with self.assertRaisesRegex(
+                ValueError,
+                r'"the_object" must be OnticType type.'):
+            o_type.perfect_object({})
 
     def test_valid_perfect_usage(self) -> NoReturn:
         """Ensure that the perfect behavior is correct."""
@@ -167,7 +351,7 @@ class PerfectObjectTestCase(BaseTestCase):
             'prop_4': 400
         }
         o_type.perfect_object(ontic_object)
-        self.assertDictEqual(expected_dict, ontic_object)
+        self.assertEqual(expected_dict, dict(ontic_object))
 
     def test_perfect_collection_types(self) -> NoReturn:
         """Ensure that collection defaults are handled correctly."""
@@ -206,6 +390,15 @@ class PerfectObjectTestCase(BaseTestCase):
         self.assertIsNot(schema_def.set_prop.default,
                          ontic_object.set_prop)
 
+    def test_perfect_untyped_default(self) -> NoReturn:
+        """Ensure a default is set for a property without a type."""
+        my_type = o_type.create_ontic_type(
+            'UntypedDefault', {'prop': {'default': 'some value'}})
+        ontic_object = my_type()
+
+        o_type.perfect_object(ontic_object)
+        self.assertEqual('some value', ontic_object.prop)
+
     def test_perfect_bad_collection_type(self) -> NoReturn:
         """Test for the handling of bad collection member o_type."""
 
@@ -296,12 +489,12 @@ class PerfectObjectTestCase(BaseTestCase):
         invalid_property_schema.member_type = 'UNKNOWN'
 
         self.maxDiff = None
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value "UNKNOWN" for "member_type" not in enumeration \[<class 'bool'>, <class 'complex'>, """
-            r"""<class 'datetime.date'>, <class 'datetime.datetime'>, <class 'datetime.time'>, <class 'dict'>, """
-            r"""<class 'float'>, <class 'int'>, <class 'list'>, <class 'set'>, <class 'str'>, <class 'tuple'>, None\].""",
-            property.validate_property, invalid_property_schema)
+        with self.assertRaisesRegex(
+                ValidationException,
+                r"""The value "UNKNOWN" for "member_type" not in enumeration \[<class 'bool'>, <class 'complex'>, """
+                r"""<class 'datetime.date'>, <class 'datetime.datetime'>, <class 'datetime.time'>, <class 'dict'>, """
+                r"""<class 'float'>, <class 'int'>, <class 'list'>, <class 'set'>, <class 'str'>, <class 'tuple'>, None\]."""):
+            property.validate_property(invalid_property_schema)
 
         value_errors = property.validate_property(
             invalid_property_schema,
@@ -317,32 +510,114 @@ class PerfectObjectTestCase(BaseTestCase):
 class ValidateObjectTestCase(BaseTestCase):
     """Test ontic_types.validate_object method basics."""
 
+    @classmethod
+    def setUpClass(cls) -> NoReturn:
+        """Create the types shared by the schema setting tests."""
+        cls.type_schema = {
+            'bool_property': {'type': 'bool'},
+            'dict_property': {'type': 'dict'},
+            'float_property': {'type': 'float'},
+            'int_property': {'type': 'int'},
+            'list_property': {'type': 'list'},
+            'ontic_property': {'type': Meta},
+            'set_property': {'type': 'set'},
+            'str_property': {'type': 'str'},
+            'date_property': {'type': 'date'},
+            'time_property': {'type': 'time'},
+            'datetime_property': {'type': 'datetime'},
+        }
+        cls.TypeCheck = o_type.create_ontic_type('TypeCheck', cls.type_schema)
+
+        cls.min_schema = {
+            'str_min_property': {'type': 'str', 'min': 5},
+            'int_min_property': {'type': 'int', 'min': 10},
+            'float_min_property': {'type': 'float', 'min': 20},
+            'list_min_property': {'type': 'list', 'min': 1},
+            'set_min_property': {'type': 'set', 'min': 1},
+            'dict_min_property': {'type': 'dict', 'min': 1},
+            'date_min_property': {'type': 'date', 'min': date(2000, 1, 1)},
+            'time_min_property': {'type': 'time', 'min': time(12, 30, 30)},
+            'datetime_min_property': {
+                'type': 'datetime', 'min': datetime(2000, 1, 1, 12, 30, 30)}
+        }
+        cls.MinCheck = o_type.create_ontic_type('MinCheck', cls.min_schema)
+        cls.min_template = cls.MinCheck({
+            'str_min_property': '8 letters',
+            'int_min_property': 20,
+            'float_min_property': 30.0,
+            'list_min_property': ['one item'],
+            'set_min_property': {'one item'},
+            'dict_min_property': {'some_kee': 'one item'},
+            'date_min_property': date(2001, 1, 1),
+            'time_min_property': time(13, 30, 30),
+            'datetime_min_property': datetime(2001, 1, 1),
+        })
+
+        cls.max_schema = {
+            'str_max_property': {'type': 'str', 'max': 5},
+            'int_max_property': {'type': 'int', 'max': 10},
+            'float_max_property': {'type': 'float', 'max': 20},
+            'list_max_property': {'type': 'list', 'max': 1},
+            'set_max_property': {'type': 'set', 'max': 1},
+            'dict_max_property': {'type': 'dict', 'max': 1},
+            'date_max_property': {'type': 'date', 'max': date(2000, 1, 1)},
+            'time_max_property': {'type': 'time', 'max': time(12, 30, 30)},
+            'datetime_max_property': {
+                'type': 'datetime', 'max': datetime(2000, 1, 1, 12, 30, 30)}
+        }
+        cls.MaxCheck = o_type.create_ontic_type('MaxCheck', cls.max_schema)
+        cls.max_template = cls.MaxCheck({
+            'str_max_property': 'small',
+            'int_max_property': 5,
+            'float_max_property': 10.0,
+            'list_max_property': ['one item'],
+            'set_max_property': {'one item'},
+            'dict_max_property': {'some_kee': 'one item'},
+            'date_max_property': date(1999, 1, 1),
+            'time_max_property': time(11, 30, 30),
+            'datetime_max_property': datetime(1999, 1, 1),
+        })
+
+        cls.RegexCheck = o_type.create_ontic_type('RegexCheck', {
+            'b_only_property': {'type': 'str', 'regex': '^b+'}
+        })
+        cls.CollectionRegexCheck = o_type.create_ontic_type(
+            'CollectionRegexCheck', {
+                'set_property': {
+                    'type': set, 'member_type': str, 'regex': 'b+'}
+            })
+        cls.RequireCheck = o_type.create_ontic_type('RequireCheck', {
+            'some_property': {'required': True},
+            'other_property': {'required': False}
+        })
+        cls.EnumCheck = o_type.create_ontic_type('EnumCheck', {
+            'enum_property': {'enum': {'some_value', 99}}
+        })
+        cls.EnumListCheck = o_type.create_ontic_type('EnumListCheck', {
+            'enum_property': {'type': 'list', 'enum': {'dog', 'cat'}}
+        })
+        cls.ItemTypeCheck = o_type.create_ontic_type('ItemTypeCheck', {
+            'list_property': {'type': 'list', 'member_type': 'str'}
+        })
+
     def test_bad_validate_object(self) -> NoReturn:
         """ValueError testing of validate_object."""
-        self.assertRaisesRegex(
-            ValueError,
-            'Validation can only support validation of objects derived from '
-            'ontic.ontic_type.OnticType.',
-            o_type.validate_object, None)
-        self.assertRaisesRegex(
-            ValueError,
-            'Validation can only support validation of objects derived from '
-            'ontic.ontic_type.OnticType.',
-            o_type.validate_object, 'Not a OnticType')
+        message = ('Validation can only support validation of objects '
+                   'derived from ontic.ontic_type.OnticType.')
+        self.assert_error(ValueError, message, o_type.validate_object, None)
+        self.assert_error(
+            ValueError, message, o_type.validate_object, 'Not a OnticType')
 
     def test_validation_exception_handling(self) -> NoReturn:
         """Ensure that validate_object handles error reporting."""
-        schema_instance = Schema(some_attr={'type': 'int'})
-        my_type = o_type.create_ontic_type('ValidateCheck',
-                                           schema_instance)
-        ontic_object = my_type()
+        ontic_object = _VALIDATE_CHECK_TYPE()
         ontic_object.some_attr = 'WRONG'
 
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value for "some_attr" is """
-            r"""not of type "<class 'int'>": WRONG""",
-            o_type.validate_object, ontic_object)
+        with self.assertRaisesRegex(
+                ValidationException,
+                r"""The value for "some_attr" is """
+                r"""not of type "<class 'int'>": WRONG"""):
+            o_type.validate_object(ontic_object)
 
         expected_errors = [
             r"""The value for "some_attr" is not """
@@ -358,62 +633,82 @@ class ValidateObjectTestCase(BaseTestCase):
                                         raise_validation_exception=False)
         self.assertListEqual(expected_errors, errors)
 
-    def test_type_setting(self) -> NoReturn:
-        """Validate 'type' schema setting."""
-        schema = {
-            'bool_property': {'type': 'bool'},
-            'dict_property': {'type': 'dict'},
-            'float_property': {'type': 'float'},
-            'int_property': {'type': 'int'},
-            'list_property': {'type': 'list'},
-            'ontic_property': {'type': Meta},
-            'set_property': {'type': 'set'},
-            'str_property': {'type': 'str'},
-            'date_property': {'type': 'date'},
-            'time_property': {'type': 'time'},
-            'datetime_property': {'type': 'datetime'},
-        }
+    def test_schema_replacement(self) -> NoReturn:
+        """Ensure validation follows a replaced ONTIC_SCHEMA."""
+        my_type = o_type.create_ontic_type(
+            'ReplacedCheck', {'prop': {'type': 'int'}})
+        ontic_object = my_type(prop='string')
+        self.assertEqual(1, len(o_type.validate_object(ontic_object, False)))
 
-        # Create the o_type
-        my_type = o_type.create_ontic_type('TypeCheck', schema)
-        self.assertIsNotNone(o_type)
+        my_type.ONTIC_SCHEMA = Schema(prop={'type': 'str'})
+        self.assertListEqual([], o_type.validate_object(ontic_object, False))
+
+    def test_schema_change(self) -> NoReturn:
+        """Ensure validation follows changes made to ONTIC_SCHEMA in place."""
+        my_type = o_type.create_ontic_type(
+            'ChangedCheck', {'a': {'type': 'int'}})
+        ontic_object = my_type(a=10)
+        self.assertListEqual([], o_type.validate_object(ontic_object, False))
+
+        my_type.ONTIC_SCHEMA.add(
+            OnticProperty(name='b', type='int', required=True))
+        self.assertListEqual(
+            ['The value for "b" is required.'],
+            o_type.validate_object(ontic_object, False))
+
+        ontic_object.b = 1
+        my_type.ONTIC_SCHEMA['a'].max = 5
+        self.assertListEqual(
+            ['The value of "10" for "a" fails max of 5.'],
+            o_type.validate_object(ontic_object, False))
+        self.assertListEqual(
+            ['The value of "10" for "a" fails max of 5.'],
+            o_type.validate_value('a', ontic_object))
+
+        ontic_object = my_type(a=1)
+        my_type.ONTIC_SCHEMA.add(OnticProperty(name='c', default='C'))
+        ontic_object.perfect()
+        self.assertDictEqual({'a': 1, 'b': None, 'c': 'C'}, ontic_object)
 
+    def test_type_setting(self) -> NoReturn:
+        """Validate 'type' schema setting."""
         # Create object of o_type
-        ontic_object = my_type()
+        ontic_object = self.TypeCheck()
 
         # Validate an empty object.
         o_type.validate_object(ontic_object)
 
         # Validate with known good data.
-        ontic_object.bool_property = True
-        ontic_object.dict_property = {'some_key': 'some_value'}
-        ontic_object.core_type_property = Meta({'key': 'val'})
-        ontic_object.float_property = 3.4
-        ontic_object.int_property = 5
-        ontic_object.list_property = [5, 6, 7]
-        ontic_object.set_property = {'dog', 'cat', 'mouse'}
-        ontic_object.str_property = 'some_string'
-        ontic_object.date_property = date(2000, 1, 1)
-        ontic_object.time_property = time(12, 30, 30)
-        ontic_object.datetime_property = datetime(2001, 1, 1, 12, 30, 30)
+        ontic_object = self.TypeCheck({
+            'bool_property': True,
+            'dict_property': {'some_key': 'some_value'},
+            'core_type_property': Meta({'key': 'val'}),
+            'float_property': 3.4,
+            'int_property': 5,
+            'list_property': [5, 6, 7],
+            'set_property': {'dog', 'cat', 'mouse'},
+            'str_property': 'some_string',
+            'date_property': date(2000, 1, 1),
+            'time_property': time(12, 30, 30),
+            'datetime_property': datetime(2001, 1, 1, 12, 30, 30),
+        })
         o_type.validate_object(ontic_object)
 
         # Validate with known bad data.
         ontic_object.bool_property = 'Dog'
-        self.assertRaisesRegex(
+        self.assert_error(
             ValidationException,
-            r"""The value for "bool_property" is not """
-            r"""of type "<class 'bool'>": Dog""",
-            o_type.validate_object, ontic_object)
-        ontic_object.bool_property = True
+            """The value for "bool_property" is not """
+            """of type "<class 'bool'>": Dog""",
+            ontic_object.validate_value, 'bool_property')
 
         # Validate a string vs a list o_type
         ontic_object.list_property = 'some_string'
-        self.assertRaisesRegex(
+        self.assert_error(
             ValidationException,
-            r"""The value for "list_property" is not """
-            r"""of type "<class 'list'>": some_string""",
-            o_type.validate_object, ontic_object)
+            """The value for "list_property" is not """
+            """of type "<class 'list'>": some_string""",
+            ontic_object.validate_value, 'list_property')
 
     def test_type_bad_setting(self) -> NoReturn:
         """ValueError for bad 'type' setting."""
@@ -421,30 +716,18 @@ class ValidateObjectTestCase(BaseTestCase):
             'some_property': {'type': 'Unknown'}
         }
 
-        self.assertRaisesRegex(
-            ValueError,
-            r"""Illegal type declaration: Unknown""",
-            o_type.create_ontic_type, 'Dummy', schema)
+        with self.assertRaisesRegex(
+                ValueError,
+                r"""Illegal type declaration: Unknown"""):
+            o_type.create_ontic_type('Dummy', schema)
 
     def test_required_setting(self) -> NoReturn:
         """Validate 'required' schema setting."""
-        schema = {
-            'some_property': {'required': True},
-            'other_property': {'required': False}
-        }
-
-        # Create the o_type
-        my_type = o_type.create_ontic_type('RequireCheck', schema)
-        self.assertIsNotNone(o_type)
-
         # Create object of o_type
-        ontic_object = my_type()
+        ontic_object = self.RequireCheck()
 
         # Validate an empty object, which should cause ValueError
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value for "some_property" is required.',
-            o_type.validate_object, ontic_object)
+        self.assert_validation_error(ontic_object, _RX_REQUIRED)
 
         # Validate with data
         ontic_object.some_property = 'Something'
@@ -453,18 +736,8 @@ class ValidateObjectTestCase(BaseTestCase):
 
     def test_enum_setting(self) -> NoReturn:
         """Validate 'enum' schema setting."""
-        # Scalar testing
-        # ###############
-        schema = {
-            'enum_property': {'enum': {'some_value', 99}}
-        }
-
-        # Create the o_type
-        my_type = o_type.create_ontic_type('EnumCheck', schema)
-        self.assertIsNotNone(my_type)
-
         # Create object of o_type
-        ontic_object = my_type()
+        ontic_object = self.EnumCheck()
 
         # Validate an empty object
         o_type.validate_object(ontic_object)
@@ -475,24 +748,12 @@ class ValidateObjectTestCase(BaseTestCase):
 
         # Validate a bad setting
         ontic_object.enum_property = 'bad, bad, bad'
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value "bad, bad, bad" for "enum_property" not in """
-            r"""enumeration (\['some_value', 99\]|\[99, 'some_value'\])\.""",
-            o_type.validate_object, ontic_object)
+        self.assert_validation_error(ontic_object, _RX_ENUM)
 
     def test_collection_enum_setting(self) -> NoReturn:
         """Validate 'enum' schema setting on collections."""
-        schema = {
-            'enum_property': {'type': 'list', 'enum': {'dog', 'cat'}}
-        }
-
-        # Create the o_type
-        my_type = o_type.create_ontic_type('EnumListCheck', schema)
-        self.assertIsNotNone(o_type)
-
         # Create object of o_type
-        ontic_object = my_type()
+        ontic_object = self.EnumListCheck()
 
         # Validate an empty object, as required not set.
         o_type.validate_object(ontic_object)
@@ -503,252 +764,43 @@ class ValidateObjectTestCase(BaseTestCase):
 
         # Validate a bad setting
         ontic_object.enum_property = ['fish']
-        self.assertRaisesRegex(
-            ValidationException,
-            r'''The value "fish" for "enum_property" not in'''
-            r''' enumeration \['cat', 'dog'\].''',
-            o_type.validate_object, ontic_object)
+        self.assert_validation_error(ontic_object, _RX_COLLECTION_ENUM)
 
     def test_min_setting(self) -> NoReturn:
         """Validate 'min' schema setting."""
-        schema = {
-            'str_min_property': {'type': 'str', 'min': 5},
-            'int_min_property': {'type': 'int', 'min': 10},
-            'float_min_property': {'type': 'float', 'min': 20},
-            'list_min_property': {'type': 'list', 'min': 1},
-            'set_min_property': {'type': 'set', 'min': 1},
-            'dict_min_property': {'type': 'dict', 'min': 1},
-            'date_min_property': {'type': 'date', 'min': date(2000, 1, 1)},
-            'time_min_property': {'type': 'time', 'min': time(12, 30, 30)},
-            'datetime_min_property': {
-                'type': 'datetime', 'min': datetime(2000, 1, 1, 12, 30, 30)}
-        }
-
-        my_type = o_type.create_ontic_type('MinCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
-
         # None test, with no required fields
-        o_type.validate_object(ontic_object)
+        o_type.validate_object(self.MinCheck())
 
         # Good test
-        ontic_object.str_min_property = '8 letters'
-        ontic_object.int_min_property = 20
-        ontic_object.float_min_property = 30.0
-        ontic_object.list_min_property = ['one item']
-        ontic_object.set_min_property = {'one item'}
-        ontic_object.dict_min_property = {'some_kee': 'one item'}
-        ontic_object.date_min_property = date(2001, 1, 1)
-        ontic_object.time_min_property = time(13, 30, 30)
-        ontic_object.datetime_min_property = datetime(2001, 1, 1)
+        ontic_object = copy(self.min_template)
         o_type.validate_object(ontic_object)
 
-        # Str failure
-        ontic_object.str_min_property = '1'
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "1" for "str_min_property" '
-            'fails min of 5.',
-            o_type.validate_object, ontic_object)
-        ontic_object.str_min_property = '8 letters'
-
-        # Int failure
-        ontic_object.int_min_property = 5
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "5" for "int_min_property" '
-            'fails min of 10.',
-            o_type.validate_object, ontic_object)
-        ontic_object.int_min_property = 20
-
-        # Float failure
-        ontic_object.float_min_property = 15.0
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "15.0" for "float_min_property" '
-            'fails min of 20.',
-            o_type.validate_object, ontic_object)
-        ontic_object.float_min_property = 30.0
-
-        # List failure
-        ontic_object.list_min_property = list()
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value of "\[\]" for "list_min_property" """
-            r"""fails min of 1.""",
-            o_type.validate_object, ontic_object)
-        ontic_object.list_min_property = ['one item']
-
-        # Set failure
-        ontic_object.set_min_property = set()
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""set\(\)" for "set_min_property" fails min of 1.""",
-            o_type.validate_object, ontic_object)
-        ontic_object.set_min_property = {'one item'}
-
-        # Dict failure
-        ontic_object.dict_min_property = dict()
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "{}" for "dict_min_property" '
-            'fails min of 1.',
-            o_type.validate_object, ontic_object)
-        ontic_object.dict_min_property = {'some_key': 'one_item'}
-
-        # Date failure
-        ontic_object.date_min_property = date(1999, 1, 1)
-        self.assertRaisesRegex(
-            ValidationException,
-            'date_min_property" fails min of 2000-01-01.',
-            o_type.validate_object, ontic_object)
-        ontic_object.date_min_property = date(2001, 1, 1)
-
-        # Time failure
-        ontic_object.time_min_property = time(11, 30, 30)
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "11:30:30" for "time_min_property" '
-            'fails min of 12:30:30.',
-            o_type.validate_object, ontic_object)
-        ontic_object.time_min_property = time(13, 30, 30)
-
-        # Datetime failure
-        ontic_object.datetime_min_property = datetime(1999, 1, 1, 11, 30, 30)
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "1999-01-01 11:30:30" for "datetime_min_property" '
-            'fails min of 2000-01-01 12:30:30.',
-            o_type.validate_object, ontic_object)
+        # Failure tests
+        for property_name, bad_value, expected_error in _MIN_FAILURES:
+            with self.subTest(property_name=property_name):
+                ontic_object[property_name] = bad_value
+                self.assert_validation_error(
+                    ontic_object, expected_error, property_name=property_name)
 
     def test_max_setting(self):
         """Validate 'max' schema setting."""
-        schema = {
-            'str_max_property': {'type': 'str', 'max': 5},
-            'int_max_property': {'type': 'int', 'max': 10},
-            'float_max_property': {'type': 'float', 'max': 20},
-            'list_max_property': {'type': 'list', 'max': 1},
-            'set_max_property': {'type': 'set', 'max': 1},
-            'dict_max_property': {'type': 'dict', 'max': 1},
-            'date_max_property': {'type': 'date', 'max': date(2000, 1, 1)},
-            'time_max_property': {'type': 'time', 'max': time(12, 30, 30)},
-            'datetime_max_property': {
-                'type': 'datetime', 'max': datetime(2000, 1, 1, 12, 30, 30)}
-        }
-
-        my_type = o_type.create_ontic_type('MaxCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
-
         # None test, with no required fields
-        o_type.validate_object(ontic_object)
+        o_type.validate_object(self.MaxCheck())
 
         # Good test
-        ontic_object.str_max_property = 'small'
-        ontic_object.int_max_property = 5
-        ontic_object.float_max_property = 10.0
-        ontic_object.list_max_property = ['one item']
-        ontic_object.set_max_property = {'one item'}
-        ontic_object.dict_max_property = {'some_kee': 'one item'}
-        ontic_object.date_max_property = date(1999, 1, 1)
-        ontic_object.time_max_property = time(11, 30, 30)
-        ontic_object.datetime_max_property = datetime(1999, 1, 1)
+        ontic_object = copy(self.max_template)
         o_type.validate_object(ontic_object)
 
-        # Str failure
-        ontic_object.str_max_property = '8 letters'
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "8 letters" for '
-            '"str_max_property" fails max of 5.',
-            o_type.validate_object, ontic_object)
-        ontic_object.str_max_property = 'small'
-
-        # Int failure
-        ontic_object.int_max_property = 20
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "20" for "int_max_property" '
-            'fails max of 10.',
-            o_type.validate_object, ontic_object)
-        ontic_object.int_max_property = 5
-
-        # Float failure
-        ontic_object.float_max_property = 30.0
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "30.0" for "float_max_property" fails max of 20.',
-            o_type.validate_object, ontic_object)
-        ontic_object.float_max_property = 15.0
-
-        # List failure
-        ontic_object.list_max_property = ['one item', 'two item']
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value of "\['(one|two) item', '(one|two) item'\]" """
-            r"""for "list_max_property" fails max of 1.""",
-            o_type.validate_object, ontic_object)
-        ontic_object.list_max_property = ['one item']
-
-        # Set failure
-        ontic_object.set_max_property = {'one item', 'two item'}
-        expected_error = r"""The value of "{'(one|two) item', '(two|one) item'}" for "set_max_property" fails max of 1."""
-
-        self.assertRaisesRegex(
-            ValidationException,
-            expected_error,
-            o_type.validate_object, ontic_object)
-
-        # Dict failure
-        ontic_object.dict_max_property = {'some_key': 'one_item',
-                                          'another_key': 'two_item'}
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value of """
-            r"""("{'some_key': 'one_item', 'another_key': 'two_item'}"|"""
-            r""""{'another_key': 'two_item', 'some_key': 'one_item'}")"""
-            r""" for "dict_max_property" fails max of 1.""",
-            o_type.validate_object, ontic_object)
-        ontic_object.dict_max_property = {'some_key': 'one_item'}
-
-        # Date failure
-        ontic_object.date_max_property = date(2001, 1, 1)
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "2001-01-01" for '
-            '"date_max_property" fails max of 2000-01-01.',
-            o_type.validate_object, ontic_object)
-        ontic_object.date_max_property = date(2001, 1, 1)
-
-        # Time failure
-        ontic_object.time_max_property = time(13, 30, 30)
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "13:30:30" for "time_max_property" '
-            'fails max of 12:30:30.',
-            o_type.validate_object, ontic_object)
-        ontic_object.time_max_property = time(13, 30, 30)
-
-        # Datetime failure
-        ontic_object.datetime_max_property = datetime(2001, 1, 1, 11, 30, 30)
-        self.assertRaisesRegex(
-            ValidationException,
-            'The value of "2001-01-01 11:30:30" for "datetime_max_property" '
-            'fails max of 2000-01-01 12:30:30.',
-            o_type.validate_object, ontic_object)
+        # Failure tests
+        for property_name, bad_value, expected_error in _MAX_FAILURES:
+            with self.subTest(property_name=property_name):
+                ontic_object[property_name] = bad_value
+                self.assert_validation_error(
+                    ontic_object, expected_error, property_name=property_name)
 
     def test_regex_setting(self):
         """Validate 'regex' schema setting."""
-        schema = {
-            'b_only_property': {'type': 'str', 'regex': '^b+'}
-        }
-
-        my_type = o_type.create_ontic_type('RegexCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
+        ontic_object = self.RegexCheck()
 
         # None test, with no required fields
         o_type.validate_object(ontic_object)
@@ -761,22 +813,14 @@ class ValidateObjectTestCase(BaseTestCase):
 
         # Bad test
         ontic_object.b_only_property = 'a'
-        self.assertRaisesRegex(
-            ValidationException,
+        self.assert_validation_error(
+            ontic_object,
             r'Value \"a\" for b_only_property does not '
-            r'meet regex: \^b\+',
-            o_type.validate_object, ontic_object)
+            r'meet regex: \^b\+')
 
     def test_member_type_setting(self) -> NoReturn:
         """Validate 'member_type' setting."""
-        schema = {
-            'list_property': {'type': 'list', 'member_type': 'str'}
-        }
-
-        my_type = o_type.create_ontic_type('ItemTypeCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
+        ontic_object = self.ItemTypeCheck()
 
         # None test, with no required fields.
         o_type.validate_object(ontic_object)
@@ -789,23 +833,14 @@ class ValidateObjectTestCase(BaseTestCase):
 
         # Bad test
         ontic_object.list_property.append(99)
-        self.assertRaisesRegex(
-            ValidationException,
+        self.assert_validation_error(
+            ontic_object,
             r'''The value "99" for "list_property" is not of type '''
-            r'''"<class 'str'>".''',
-            o_type.validate_object, ontic_object)
+            r'''"<class 'str'>".''')
 
     def test_collection_regex_setting(self) -> NoReturn:
         """Validate string collection with 'regex' setting."""
-        schema = {
-            'set_property': {'type': set, 'member_type': str, 'regex': 'b+'}
-        }
-
-        my_type = o_type.create_ontic_type(
-            'CollectionRegexCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
+        ontic_object = self.CollectionRegexCheck()
 
         # None test, with no required fields.
         o_type.validate_object(ontic_object)
@@ -818,78 +853,62 @@ class ValidateObjectTestCase(BaseTestCase):
 
         # Bad test
         ontic_object.set_property.add('xxxxxx')
-        self.assertRaisesRegex(
-            ValidationException,
-            r'''Value "xxxxxx" for "set_property" does not meet regex: b+''',
-            o_type.validate_object, ontic_object)
+        self.assert_validation_error(
+            ontic_object,
+            r'''Value "xxxxxx" for "set_property" '''
+            r'''does not meet regex: b+''')
 
     def test_member_min_setting(self) -> NoReturn:
         """Validate 'member_min' setting."""
-        # Test the item min setting for string items.
-        schema = {
-            'list_property': {'type': 'list', 'member_type': 'str',
-                              'member_min': 4}
-        }
-
-        my_type = o_type.create_ontic_type('StrItemMinCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
-
-        # None test, with no required fields.
-        o_type.validate_object(ontic_object)
-
-        # Good Test
-        ontic_object.list_property = []
-        o_type.validate_object(ontic_object)
-        ontic_object.list_property.append('four')
-        o_type.validate_object(ontic_object)
-
-        # Bad Test
-        ontic_object.list_property.append('one')
-        self.assertRaisesRegex(
-            ValidationException,
-            r'''The value of "one" for "list_property" '''
-            r'''fails min length of 4.''',
-            o_type.validate_object, ontic_object)
-
-        # Test the item min setting for numeric items.
-        schema = {
-            'list_property': {'type': 'list', 'member_type': 'int',
-                              'member_min': 4}
-        }
-
-        my_type = o_type.create_ontic_type('StrItemMinCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
-
-        # None test, with no required fields.
-        o_type.validate_object(ontic_object)
-
-        # Good Test
-        ontic_object.list_property = []
-        o_type.validate_object(ontic_object)
-        ontic_object.list_property.append(4)
-        o_type.validate_object(ontic_object)
-
-        # Bad Test
-        ontic_object.list_property.append(1)
-        self.assertRaisesRegex(
-            ValidationException,
-            r'''The value of "1" for "list_property" fails min size of 4.''',
-            o_type.validate_object, ontic_object)
+        cases = (
+            ('str', 'four', 'one',
+             r'''The value of "one" for "list_property" '''
+             r'''fails min length of 4.'''),
+            ('int', 4, 1,
+             r'''The value of "1" for "list_property" '''
+             r'''fails min size of 4.'''),
+        )
+        for member_type, good_member, bad_member, expected_error in cases:
+            with self.subTest(member_type=member_type):
+                self._assert_member_setting(
+                    'member_min', member_type, good_member, bad_member,
+                    expected_error)
 
     def test_member_max_setting(self) -> NoReturn:
         """Validate 'member_max' setting."""
-        # Test the item max setting for string items.
+        cases = (
+            ('str', 'four', 'seven',
+             r'''The value of "seven" for "list_property" '''
+             r'''fails max length of 4.'''),
+            ('int', 4, 7,
+             r'''The value of "7" for "list_property" '''
+             r'''fails max size of 4.'''),
+        )
+        for member_type, good_member, bad_member, expected_error in cases:
+            with self.subTest(member_type=member_type):
+                self._assert_member_setting(
+                    'member_max', member_type, good_member, bad_member,
+                    expected_error)
+
+    def _assert_member_setting(self,
+                               setting: str,
+                               member_type: str,
+                               good_member,
+                               bad_member,
+                               expected_error: str) -> NoReturn:
+        """Assert a list property member bound setting of 4.
+
+        :param setting: The member bound setting, member_min or member_max.
+        :param member_type: The member_type of the list property.
+        :param good_member: A member value that is within the bound.
+        :param bad_member: A member value that is outside of the bound.
+        :param expected_error: Regex of the error for the bad member.
+        """
         schema = {
             'list_property': {
-                'type': 'list', 'member_type': 'str', 'member_max': 4}
+                'type': 'list', 'member_type': member_type, setting: 4}
         }
-
-        my_type = o_type.create_ontic_type('StrItemMinCheck', schema)
-        self.assertIsNotNone(my_type)
+        my_type = o_type.create_ontic_type('ItemBoundCheck', schema)
 
         ontic_object = my_type()
 
@@ -899,43 +918,12 @@ class ValidateObjectTestCase(BaseTestCase):
         # Good Test
         ontic_object.list_property = []
         o_type.validate_object(ontic_object)
-        ontic_object.list_property.append('four')
+        ontic_object.list_property.append(good_member)
         o_type.validate_object(ontic_object)
 
         # Bad Test
-        ontic_object.list_property.append('seven')
-        self.assertRaisesRegex(
-            ValidationException,
-            r'''The value of "seven" for "list_property" '''
-            r'''fails max length of 4.''',
-            o_type.validate_object, ontic_object)
-
-        # Test the item min setting for numeric items.
-        schema = {
-            'list_property': {
-                'type': 'list', 'member_type': 'int', 'member_max': 4}
-        }
-
-        my_type = o_type.create_ontic_type('StrItemMinCheck', schema)
-        self.assertIsNotNone(o_type)
-
-        ontic_object = my_type()
-
-        # None test, with no required fields.
-        o_type.validate_object(ontic_object)
-
-        # Good Test
-        ontic_object.list_property = []
-        o_type.validate_object(ontic_object)
-        ontic_object.list_property.append(4)
-        o_type.validate_object(ontic_object)
-
-        # Bad Test
-        ontic_object.list_property.append(7)
-        self.assertRaisesRegex(
-            ValidationException,
-            r'''The value of "7" for "list_property" fails max size of 4.''',
-            o_type.validate_object, ontic_object)
+        ontic_object.list_property.append(bad_member)
+        self.assert_validation_error(ontic_object, expected_error)
 
 
 class ValidateValueTestCase(BaseTestCase):
@@ -943,57 +931,37 @@ class ValidateValueTestCase(BaseTestCase):
 
     def test_bad_validate_value(self) -> NoReturn:
         """ValueError testing of validate_value."""
-        self.assertRaisesRegex(
-            ValueError,
-            '"ontic_object" is required, cannot be None.',
-            o_type.validate_value, 'some_value', None)
-
-        self.assertRaisesRegex(
-            ValueError,
-            '"ontic_object" must be OnticType or child type of OnticType',
-            o_type.validate_value, 'some_value', "can't be string")
-
-        my_type = o_type.create_ontic_type(
-            'BadValidateValue',
-            {
-                'prop1': {'type': 'int'}
-            })
-        ontic_object = my_type()
+        ontic_object = _BAD_VALIDATE_VALUE_TYPE()
         ontic_object.prop1 = 1
 
-        self.assertRaisesRegex(
-            ValueError,
-            '"property_name" is required, cannot be None.',
-            o_type.validate_value, None, ontic_object)
-
-        self.assertRaisesRegex(
-            ValueError,
-            r'"property_name" is not a valid string.',
-            o_type.validate_value, '', ontic_object)
-
-        self.assertRaisesRegex(
-            ValueError,
-            '"property_name" is not a valid string.',
-            o_type.validate_value, 5, ontic_object)
-
-        self.assertRaisesRegex(
-            ValueError,
-            '"illegal property name" is not a recognized property.',
-            o_type.validate_value, 'illegal property name', ontic_object)
+        cases = (
+            ('some_value', None,
+             '"ontic_object" is required, cannot be None.'),
+            ('some_value', "can't be string",
+             '"ontic_object" must be OnticType or child type of OnticType.'),
+            (None, ontic_object,
+             '"property_name" is required, cannot be None.'),
+            ('', ontic_object, '"property_name" is not a valid string.'),
+            (5, ontic_object, '"property_name" is not a valid string.'),
+            ('illegal property name', ontic_object,
+             '"illegal property name" is not a recognized property.'),
+        )
+        for property_name, target, message in cases:
+            with self.subTest(property_name=property_name):
+                self.assert_error(ValueError, message,
+                                  o_type.validate_value, property_name, target)
 
     def test_validate_value_exception_handling(self) -> NoReturn:
         """Ensure validation exception handling by validation_object method."""
-        schema_instance = Schema(some_attr={'type': 'int'})
-        my_type = o_type.create_ontic_type('ValidateCheck',
-                                           schema_instance)
-        ontic_object = my_type()
+        ontic_object = _VALIDATE_CHECK_TYPE()
         ontic_object.some_attr = 'WRONG'
 
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The value for "some_attr" is not of type "<class 'int'>":"""
-            r""" WRONG""",
-            ontic_object.validate_value, 'some_attr')
+        with self.assertRaisesRegex(
+                ValidationException,
+                r"""The value for "some_attr" is not of type """
+                r""""<class 'int'>":"""
+                r""" WRONG"""):
+            ontic_object.validate_value('some_attr')
 
         with self.assertRaises(ValidationException) as ve:
             ontic_object.validate_value('some_attr')
@@ -1081,13 +1049,13 @@ class SettingOnticTypeTestCase(BaseTestCase):
         parent.child_prop = ChildOnticType()
         parent.child_prop.int_prop = '1'
 
-        self.assertRaisesRegex(
-            ValidationException,
-            r"""The child property child_prop, has errors:: """
-            r"""The value for "int_prop" is not of o_type "<class 'int'>": 1"""
-            r""" || The value for "str_prop" is required.""",
-            parent.validate,
-            raise_validation_exception=True)
+        with self.assertRaisesRegex(
+                ValidationException,
+                r"""The child property child_prop, has errors:: """
+                r"""The value for "int_prop" is not of o_type """
+                r""""<class 'int'>": 1"""
+                r""" || The value for "str_prop" is required."""):
+            parent.validate(raise_validation_exception=True)
 
     def test_ontic_type_default_setting(self) -> NoReturn:
         """Ensure that an OnticType property default is copied upon perfect."""
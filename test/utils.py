@@ -1,12 +1,60 @@
 """Utilities for testing."""
+import re
 import unittest
 
 import ontic
+from ontic import type as o_type
 
 
 class BaseTestCase(unittest.TestCase):
     """BaseTest case has methods to test Ontic features and functionality."""
 
+    def assert_error(self, exc_type, message, fn, *args, **kwargs):
+        """Assert that calling fn raises exc_type with exactly message.
+
+        :param exc_type: The type of exception expected to be raised.
+        :type exc_type: type
+        :param message: The complete expected exception message.
+        :type message: str
+        :param fn: The callable under test.
+        :param args: Positional arguments passed to fn.
+        :param kwargs: Keyword arguments passed to fn.
+        """
+        with self.assertRaises(exc_type) as context:
+            fn(*args, **kwargs)
+        self.assertEqual(message, str(context.exception))
+
+    def assert_validation_error(self, ontic_object, pattern,
+                                property_name=None):
+        """Assert that validating ontic_object reports a matching error.
+
+        The errors are collected with *raise_validation_exception* set to
+        False, so no ValidationException is raised for the check.
+
+        :param ontic_object: Ontic object expected to fail validation.
+        :type ontic_object: ontic.OnticType
+        :param pattern: Regex expected to match one of the reported errors.
+        :type pattern: str, re.Pattern
+        :param property_name: If given, only that property is validated.
+        :type property_name: str
+        """
+        if property_name is None:
+            errors = o_type.validate_object(ontic_object, False)
+        else:
+            errors = o_type.validate_value(property_name, ontic_object, False)
+        self.assertTrue(
+            any(re.search(pattern, error) for error in errors),
+            'No error matching %r in %r' % (pattern, errors))
+
+    #: Values assigned by attribute in assert_dynamic_accessing.
+    _ATTRIBUTE_PROBES = {'attr1': 1, 'attr2': 'Some string'}
+
+    #: Values assigned by key in assert_dynamic_accessing.
+    _KEY_PROBES = {'key1': 3, 'key2': 'Some value'}
+
+    #: All values expected after the assert_dynamic_accessing assignments.
+    _ALL_PROBES = dict(_ATTRIBUTE_PROBES, **_KEY_PROBES)
+
     def assert_dynamic_accessing(
             self, ontic_object):
         """Assert that ontic_object exhibits dynamic property accessing.
@@ -15,21 +63,23 @@ class BaseTestCase(unittest.TestCase):
         :type ontic_object: core_type.CoreType
         """
         # Assignment by attribute
-        ontic_object.attr1 = 1
-        self.assertEqual(1, ontic_object.attr1)
-        self.assertEqual(1, ontic_object['attr1'])
-        ontic_object.attr2 = 'Some string'
-        self.assertEqual('Some string', ontic_object.attr2)
-        self.assertEqual('Some string', ontic_object['attr2'])
+        for name, value in self._ATTRIBUTE_PROBES.items():
+            setattr(ontic_object, name, value)
 
         # Assignment by key
-        ontic_object['key1'] = 3
-        self.assertEqual(3, ontic_object['key1'], 3)
-        self.assertEqual(3, ontic_object.key1)
-        ontic_object['key2'] = 'Some value'
-        self.assertEqual('Some value', ontic_object['key2'])
-        self.assertEqual('Some value', ontic_object.key2)
+        for name, value in self._KEY_PROBES.items():
+            ontic_object[name] = value
+
+        # Every assignment is visible as both a key and an attribute.
+        self.assertDictEqual(
+            self._ALL_PROBES,
+            {name: ontic_object[name] for name in self._ALL_PROBES})
+        self.assertDictEqual(
+            self._ALL_PROBES,
+            {name: getattr(ontic_object, name) for name in self._ALL_PROBES})
 
         # Retrieval failures follow expected interface behavior
-        self.assertRaises(AttributeError, getattr, ontic_object, 'no_attribute')
-        self.assertRaises(KeyError, lambda: ontic_object['bad_key'])
+        with self.assertRaises(AttributeError):
+            getattr(ontic_object, 'no_attribute')
+        with self.assertRaises(KeyError):
+            ontic_object['bad_key']